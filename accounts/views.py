@@ -16,6 +16,7 @@ from classrooms.models import Classroom
 from subjects.models import Subject
 from django.db import transaction
 from utils.social import get_user_info
+from utils.reference_cache import get_classroom_id, get_subject_ids
 from utils.slack import send_success_slack, send_error_slack
 from datetime import datetime
 
@@ -46,20 +47,18 @@ class SignUpView(APIView):
             role = data["role"]
 
             if role == "teacher":
-                Teacher.objects.create(user=user, teacher_code=data["teacherCode"])
-                classroom = Classroom.objects.filter(grade=data["grade"], class_number=data["classNumber"]).first()
-                if classroom:
-                    classroom.teacher = Teacher.objects.get(user=user)
-                    classroom.save()
-
-                for subject_name in data["subjects"]:
-                    subject = Subject.objects.filter(name=subject_name).first()
-                    if subject:
-                        subject.teacher = Teacher.objects.get(user=user)
-                        subject.save()
+                teacher = Teacher.objects.create(user=user, teacher_code=data["teacherCode"])
+                classroom_id = get_classroom_id(data["grade"], data["classNumber"])
+                if classroom_id:
+                    Classroom.objects.filter(id=classroom_id).update(teacher=teacher)
+
+                subject_ids = get_subject_ids(data["subjects"]).values()
+                if subject_ids:
+                    Subject.objects.filter(id__in=subject_ids).update(teacher=teacher)
 
             elif role == "student":
-                classroom = Classroom.objects.filter(grade=data["grade"], class_number=data["classNumber"]).first()
+                classroom_id = get_classroom_id(data["grade"], data["classNumber"])
+                classroom = Classroom.objects.select_related('teacher__user').filter(id=classroom_id).first() if classroom_id else None
                 student = Student.objects.create(
                     user=user,
                     classroom=classroom,
@@ -387,9 +386,8 @@ class SocialRegisterDetailView(APIView):
 
         try:
             if role == "student":
-                classroom = Classroom.objects.filter(
-                    grade=data.get("grade"), class_number=data.get("classNumber")
-                ).first()
+                classroom_id = get_classroom_id(data.get("grade"), data.get("classNumber"))
+                classroom = Classroom.objects.select_related('teacher__user').filter(id=classroom_id).first() if classroom_id else None
                 if not classroom:
                     send_error_slack(request, "소셜 회원 추가 정보 등록", start_time)
                     return Response({"error": "해당 반이 존재하지 않습니다."}, status=400)
@@ -409,20 +407,15 @@ class SocialRegisterDetailView(APIView):
                 )
 
             elif role == "teacher":
-                Teacher.objects.create(user=user, teacher_code=data["teacherCode"])
-
-                classroom = Classroom.objects.filter(
-                    grade=data.get("grade"), class_number=data.get("classNumber")
-                ).first()
-                if classroom:
-                    classroom.teacher = Teacher.objects.get(user=user)
-                    classroom.save()
-
-                for subject_name in data.get("subjects", []):
-                    subject = Subject.objects.filter(name=subject_name).first()
-                    if subject:
-                        subject.teacher = Teacher.objects.get(user=user)
-                        subject.save()
+                teacher = Teacher.objects.create(user=user, teacher_code=data["teacherCode"])
+
+                classroom_id = get_classroom_id(data.get("grade"), data.get("classNumber"))
+                if classroom_id:
+                    Classroom.objects.filter(id=classroom_id).update(teacher=teacher)
+
+                subject_ids = get_subject_ids(data.get("subjects", [])).values()
+                if subject_ids:
+                    Subject.objects.filter(id__in=subject_ids).update(teacher=teacher)
 
             elif role == "parent":
                 parent = Parent.objects.create(user=user)
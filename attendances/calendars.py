@@ -0,0 +1,124 @@
+from datetime import timedelta
+from django.db import transaction
+from schedules.days import (
+    CALENDAR_DAYS, school_year, year_start, day_index, index_date, range_mask, school_day_mask, to_bits, from_bits
+)
+from .models import AttendanceRecord, AttendanceCalendar
+from .counters import ATTENDANCE_TYPES, key_filters, lock_keys
+
+
+def _build_rows(records):
+    bitmaps = {}
+    for student_id, grade, year, attendance_type, day in records.values_list(
+        'student_id', 'grade', 'year', 'attendance_type', 'date'
+    ):
+        index = day_index(year, day)
+        if index is None:
+            continue
+        key = (student_id, grade, year, attendance_type)
+        bitmaps[key] = bitmaps.get(key, 0) | (1 << index)
+    return [
+        AttendanceCalendar(
+            student_id=student_id,
+            grade=grade,
+            year=year,
+            attendance_type=attendance_type,
+            days=from_bits(bits)
+        )
+        for (student_id, grade, year, attendance_type), bits in bitmaps.items()
+    ]
+
+
+def refresh_calendars(keys):
+    # keys: (student_id, grade, year) 목록
+    with transaction.atomic():
+        lock_keys(keys)
+        for condition in key_filters(keys):
+            AttendanceCalendar.objects.filter(condition).delete()
+            AttendanceCalendar.objects.bulk_create(_build_rows(AttendanceRecord.objects.filter(condition)), batch_size=500)
+
+
+def rebuild_calendars(year=None):
+    records = AttendanceRecord.objects.all()
+    calendars = AttendanceCalendar.objects.all()
+    if year is not None:
+        records = records.filter(year=year)
+        calendars = calendars.filter(year=year)
+    with transaction.atomic():
+        calendars.delete()
+        rows = AttendanceCalendar.objects.bulk_create(_build_rows(records), batch_size=500)
+    return len(rows)
+
+
+def bit_indexes(bits):
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+def longest_streak(bits, school_days):
+    # 수업일이 아닌 날은 연속으로 이어 붙여, 수업일 기준 최장 연속 일수를 구함
+    filled = bits | ~school_days
+    best = (0, None, None)
+    index = 0
+    while bits >> index:
+        if not (bits >> index) & 1:
+            index += 1
+            continue
+        start = index
+        while (filled >> index) & 1 and index < CALENDAR_DAYS:
+            index += 1
+        run = ((1 << (index - start)) - 1) << start
+        length = (bits & school_days & run).bit_count()
+        if length > best[0]:
+            end = (bits & run).bit_length() - 1
+            best = (length, start, end)
+    return best
+
+
+def calendar_summary(calendar, start=None, end=None):
+    bits = to_bits(calendar.days)
+    school_days = school_day_mask(calendar.year)
+    length, first, last = longest_streak(bits, school_days)
+    summary = {
+        "count": bits.bit_count(),
+        "dates": [index_date(calendar.year, index) for index in bit_indexes(bits)],
+        "longestStreak": {
+            "days": length,
+            "start": index_date(calendar.year, first) if length else None,
+            "end": index_date(calendar.year, last) if length else None
+        }
+    }
+    if start and end:
+        summary["inRange"] = (bits & range_mask(calendar.year, start, end)).bit_count()
+    return summary
+
+
+def student_calendars(student, grade=None, year=None, start=None, end=None):
+    calendars = AttendanceCalendar.objects.filter(student=student)
+    if grade:
+        calendars = calendars.filter(grade=grade)
+    if year:
+        calendars = calendars.filter(year=year)
+
+    result = {}
+    for calendar in calendars.order_by('year', 'grade'):
+        item = result.setdefault((calendar.grade, calendar.year), {
+            "grade": calendar.grade,
+            "year": calendar.year,
+            "start": year_start(calendar.year),
+            "end": year_start(calendar.year + 1) - timedelta(days=1),
+            "types": {}
+        })
+        item["types"][calendar.attendance_type] = calendar_summary(calendar, start, end)
+
+    for item in result.values():
+        for typ in ATTENDANCE_TYPES:
+            item["types"].setdefault(typ, {
+                "count": 0,
+                "dates": [],
+                "longestStreak": {"days": 0, "start": None, "end": None},
+                **({"inRange": 0} if start and end else {})
+            })
+    return list(result.values())
@@ -0,0 +1,42 @@
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from .models import AttendanceRecord
+from .signals import deferred_refresh, refresh_keys
+
+KEY_FIELDS = ('attendance_type', 'reason_type')
+DAY_FIELDS = ('student_id', 'grade', 'year', 'date')
+
+
+def _conflicts(condition, changes):
+    # 바꾼 뒤 (학생, 학년, 연도, 유형, 사유, 날짜)가 이미 있는 행과 겹치거나
+    # 대상끼리 같은 키가 되는 경우, 남길 한 건(먼저 있던 행)을 빼고 지움
+    same_day = {field: OuterRef(field) for field in DAY_FIELDS}
+    others = AttendanceRecord.objects.exclude(condition).filter(
+        **same_day, **{field: changes.get(field, OuterRef(field)) for field in KEY_FIELDS}
+    )
+    earlier = AttendanceRecord.objects.filter(
+        condition, **same_day, **{field: OuterRef(field) for field in KEY_FIELDS if field not in changes},
+        id__lt=OuterRef('id')
+    )
+    return Exists(others) | Exists(earlier)
+
+
+def correct_records(condition, changes=None):
+    # changes 가 없으면 조건에 맞는 기록 삭제, 있으면 해당 필드로 일괄 수정
+    records = AttendanceRecord.objects.filter(condition)
+    result = {"deleted": 0, "updated": 0, "merged": 0}
+    # 삭제 시그널로 들어오는 집계/달력 갱신은 모아서 마지막에 한번만 처리
+    with transaction.atomic(), deferred_refresh():
+        keys = set(records.values_list('student_id', 'grade', 'year').distinct())
+        if not keys:
+            return result
+
+        if changes is None:
+            result["deleted"], _ = records.delete()
+        else:
+            if any(field in changes for field in KEY_FIELDS):
+                result["merged"], _ = records.filter(_conflicts(condition, changes)).delete()
+            # update()는 시그널을 보내지 않으므로 대상 키를 직접 갱신 목록에 넣음
+            result["updated"] = records.update(**changes)
+            refresh_keys(keys)
+    return result
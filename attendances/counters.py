@@ -0,0 +1,79 @@
+from django.db import transaction
+from django.db.models import Count, Q
+from students.models import Student
+from .models import AttendanceRecord, AttendanceCounter
+
+ATTENDANCE_TYPES = [choice for choice, _ in AttendanceRecord.ATTENDANCE_TYPE_CHOICES]
+REASON_TYPES = [choice for choice, _ in AttendanceRecord.REASON_TYPE_CHOICES]
+
+# OR 조건이 너무 길어지지 않도록 키를 나눠서 조회
+KEY_CHUNK = 200
+
+
+def key_filters(keys):
+    keys = sorted(set(keys), key=str)
+    for index in range(0, len(keys), KEY_CHUNK):
+        condition = Q()
+        for student_id, grade, year in keys[index:index + KEY_CHUNK]:
+            condition |= Q(student_id=student_id, grade=grade, year=year)
+        yield condition
+
+
+def lock_keys(keys):
+    # 같은 학생의 집계/달력을 동시에 지우고 다시 쓰면 unique 충돌이 나므로 학생 행을 잠가 순서대로 처리
+    # 교착을 피하려고 id 순으로 잠금, 호출하는 쪽 트랜잭션이 끝날 때까지 유지
+    student_ids = sorted({student_id for student_id, _, _ in keys})
+    list(Student.objects.select_for_update().filter(id__in=student_ids).order_by('id').values_list('id', flat=True))
+
+
+def _count_rows(records):
+    return [
+        AttendanceCounter(
+            student_id=student_id,
+            grade=grade,
+            year=year,
+            attendance_type=attendance_type,
+            reason_type=reason_type,
+            count=count
+        )
+        for student_id, grade, year, attendance_type, reason_type, count in records.values(
+            'student_id', 'grade', 'year', 'attendance_type', 'reason_type'
+        ).annotate(count=Count('id')).values_list(
+            'student_id', 'grade', 'year', 'attendance_type', 'reason_type', 'count'
+        )
+    ]
+
+
+def refresh_counters(keys):
+    # keys: (student_id, grade, year) 목록, 해당 학생/학년/연도의 집계를 원본 기준으로 다시 씀
+    with transaction.atomic():
+        lock_keys(keys)
+        for condition in key_filters(keys):
+            AttendanceCounter.objects.filter(condition).delete()
+            AttendanceCounter.objects.bulk_create(_count_rows(AttendanceRecord.objects.filter(condition)), batch_size=500)
+
+
+def rebuild_counters(year=None):
+    records = AttendanceRecord.objects.all()
+    counters = AttendanceCounter.objects.all()
+    if year is not None:
+        records = records.filter(year=year)
+        counters = counters.filter(year=year)
+    with transaction.atomic():
+        counters.delete()
+        rows = AttendanceCounter.objects.bulk_create(_count_rows(records), batch_size=500)
+    return len(rows)
+
+
+def counter_stats(counters):
+    # {(grade, year): {유형: {사유: 건수}}}
+    stats = {}
+    for grade, year, attendance_type, reason_type, count in counters.values_list(
+        'grade', 'year', 'attendance_type', 'reason_type', 'count'
+    ):
+        stat = stats.setdefault((grade, year), {
+            typ: dict.fromkeys(REASON_TYPES, 0) for typ in ATTENDANCE_TYPES
+        })
+        if attendance_type in stat and reason_type in stat[attendance_type]:
+            stat[attendance_type][reason_type] += count
+    return stats
@@ -0,0 +1,75 @@
+from django.db.models import Count
+from .models import AttendanceRecord
+from .counters import ATTENDANCE_TYPES, REASON_TYPES
+
+
+def _empty_counts():
+    return {typ: dict.fromkeys(REASON_TYPES, 0) for typ in ATTENDANCE_TYPES}
+
+
+def _add(counts, attendance_type, reason_type, count):
+    if attendance_type in counts and reason_type in counts[attendance_type]:
+        counts[attendance_type][reason_type] += count
+
+
+def build_dashboard(students, start, end):
+    # students: 대상 학생 queryset, 학생별·일자별 합계를 각각 GROUP BY 한 번으로 계산
+    records = AttendanceRecord.objects.filter(student__in=students.values('id'), date__range=(start, end))
+    students = list(students.select_related('user', 'classroom').order_by(
+        'classroom__class_number', 'student_number', 'id'
+    ))
+
+    per_student = {student.id: _empty_counts() for student in students}
+    student_totals = dict.fromkeys(per_student, 0)
+    for student_id, attendance_type, reason_type, count in records.values(
+        'student_id', 'attendance_type', 'reason_type'
+    ).annotate(count=Count('id')).values_list('student_id', 'attendance_type', 'reason_type', 'count'):
+        _add(per_student[student_id], attendance_type, reason_type, count)
+        student_totals[student_id] += count
+
+    per_day = {}
+    totals = _empty_counts()
+    for date, attendance_type, reason_type, count in records.values(
+        'date', 'attendance_type', 'reason_type'
+    ).annotate(count=Count('id')).order_by('date').values_list('date', 'attendance_type', 'reason_type', 'count'):
+        day = per_day.setdefault(date, {"date": date, "total": 0, "counts": _empty_counts()})
+        _add(day["counts"], attendance_type, reason_type, count)
+        _add(totals, attendance_type, reason_type, count)
+        day["total"] += count
+
+    return {
+        "start": start,
+        "end": end,
+        "totals": totals,
+        "students": [
+            {
+                "id": student.id,
+                "studentId": student.student_id,
+                "name": student.user.name,
+                "classNumber": student.classroom.class_number if student.classroom else None,
+                "number": student.student_number,
+                "total": student_totals[student.id],
+                "counts": per_student[student.id]
+            }
+            for student in students
+        ],
+        "days": list(per_day.values())
+    }
+
+
+def classroom_totals(dashboard):
+    # 학년 대시보드용 반별 합계 (학생별 집계를 다시 묶기만 함)
+    classrooms = {}
+    for student in dashboard["students"]:
+        item = classrooms.setdefault(student["classNumber"], {
+            "classNumber": student["classNumber"],
+            "students": 0,
+            "total": 0,
+            "counts": _empty_counts()
+        })
+        item["students"] += 1
+        item["total"] += student["total"]
+        for typ, reasons in student["counts"].items():
+            for reason, count in reasons.items():
+                item["counts"][typ][reason] += count
+    return list(classrooms.values())
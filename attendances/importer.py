@@ -0,0 +1,172 @@
+import csv
+import time
+from datetime import date
+from django.db import transaction
+from students.models import Student
+from .models import AttendanceRecord, AttendanceSummary
+from .counters import refresh_counters
+from .calendars import refresh_calendars, school_year
+from schedules.days import total_days as instructional_days
+
+BATCH_SIZE = 1000
+# API 요청 안에서 처리하는 파일 크기 상한, 더 큰 파일은 import_attendance_csv 명령으로 가져옴
+API_MAX_BYTES = 2 * 1024 * 1024
+# 거부된 행은 개수는 모두 세되 내용은 앞부분만 보관
+REJECTED_LIMIT = 100
+
+HEADER_ALIASES = {
+    "studentId": ["studentId", "학번"],
+    "grade": ["grade", "학년"],
+    "year": ["year", "학년도"],
+    "date": ["date", "일자", "날짜"],
+    "attendanceType": ["attendanceType", "출결구분"],
+    "reasonType": ["reasonType", "사유구분"],
+    "reason": ["reason", "사유"],
+}
+REQUIRED_COLUMNS = ["studentId", "date", "attendanceType", "reasonType"]
+
+# 코드값('absence')과 표시값('결석') 모두 허용
+TYPE_CODES = {
+    **{code: code for code, _ in AttendanceRecord.ATTENDANCE_TYPE_CHOICES},
+    **{label: code for code, label in AttendanceRecord.ATTENDANCE_TYPE_CHOICES},
+}
+REASON_CODES = {
+    **{code: code for code, _ in AttendanceRecord.REASON_TYPE_CHOICES},
+    **{label: code for code, label in AttendanceRecord.REASON_TYPE_CHOICES},
+}
+
+
+def _columns(header):
+    positions = {name.strip(): index for index, name in enumerate(header)}
+    columns = {}
+    for field, aliases in HEADER_ALIASES.items():
+        for alias in aliases:
+            if alias in positions:
+                columns[field] = positions[alias]
+                break
+    missing = [field for field in REQUIRED_COLUMNS if field not in columns]
+    if missing:
+        raise ValueError("필수 컬럼이 없습니다: " + ", ".join(missing))
+    return columns
+
+
+def _parse(row, columns):
+    def value(field):
+        index = columns.get(field)
+        return row[index].strip() if index is not None and index < len(row) else ""
+
+    attendance_type = TYPE_CODES.get(value("attendanceType"))
+    if attendance_type is None:
+        raise ValueError(f"알 수 없는 출결구분: {value('attendanceType')}")
+    reason_type = REASON_CODES.get(value("reasonType"))
+    if reason_type is None:
+        raise ValueError(f"알 수 없는 사유구분: {value('reasonType')}")
+    day = date.fromisoformat(value("date"))
+    year = value("year")
+    return {
+        "studentId": value("studentId"),
+        "grade": value("grade").removesuffix("학년"),
+        "year": int(year) if year else school_year(day),
+        "date": day,
+        "attendanceType": attendance_type,
+        "reasonType": reason_type,
+        "reason": value("reason"),
+    }
+
+
+def _reject(stats, line, error):
+    stats["rejected"] += 1
+    if len(stats["rejectedRows"]) < REJECTED_LIMIT:
+        stats["rejectedRows"].append({"line": line, "error": error})
+
+
+def _write_batch(batch, stats):
+    students = {
+        code: (student_id, classroom_grade)
+        for code, student_id, classroom_grade in Student.objects.filter(
+            student_id__in={item["studentId"] for _, item in batch}
+        ).values_list('student_id', 'id', 'classroom__grade')
+    }
+    existing = set()
+    resolved = [(line, item, students.get(item["studentId"])) for line, item in batch]
+    student_ids = {student[0] for _, _, student in resolved if student}
+    if student_ids:
+        existing = set(AttendanceRecord.objects.filter(
+            student_id__in=student_ids,
+            date__range=(min(item["date"] for _, item in batch), max(item["date"] for _, item in batch))
+        ).values_list('student_id', 'grade', 'year', 'attendance_type', 'reason_type', 'date'))
+
+    records = []
+    for line, item, student in resolved:
+        if student is None:
+            _reject(stats, line, f"해당 학생이 존재하지 않습니다: {item['studentId']}")
+            continue
+        student_id, classroom_grade = student
+        grade = item["grade"] or (str(classroom_grade) if classroom_grade else "")
+        if not grade:
+            _reject(stats, line, "학년을 알 수 없습니다.")
+            continue
+        key = (student_id, grade, item["year"], item["attendanceType"], item["reasonType"], item["date"])
+        if key in existing:
+            stats["duplicates"] += 1
+            continue
+        existing.add(key)
+        records.append(AttendanceRecord(
+            student_id=student_id,
+            grade=grade,
+            year=item["year"],
+            date=item["date"],
+            attendance_type=item["attendanceType"],
+            reason_type=item["reasonType"],
+            reason=item["reason"]
+        ))
+
+    keys = {(record.student_id, record.grade, record.year) for record in records}
+    with transaction.atomic():
+        AttendanceRecord.objects.bulk_create(records, ignore_conflicts=True)
+        AttendanceSummary.objects.bulk_create([
+            AttendanceSummary(student_id=student_id, grade=grade, year=year, total_days=instructional_days(year), remarks="", home_teacher="")
+            for student_id, grade, year in keys
+        ], ignore_conflicts=True)
+        # bulk_create는 시그널을 보내지 않으므로 배치마다 집계를 직접 갱신
+        refresh_counters(keys)
+        refresh_calendars(keys)
+    stats["created"] += len(records)
+
+
+def import_attendance_csv(stream, batch_size=BATCH_SIZE, progress=None):
+    # stream: 텍스트 파일 객체, 한 번에 batch_size 행만 메모리에 올림
+    # 배치마다 커밋하므로 중간에 파일을 읽지 못하면 멈추고, 그때까지 반영된 건수와 함께 error 를 돌려줌
+    started = time.monotonic()
+    reader = csv.reader(stream)
+    columns = _columns(next(reader, []))
+    stats = {"rows": 0, "created": 0, "duplicates": 0, "rejected": 0, "rejectedRows": []}
+
+    batch = []
+    try:
+        for line, row in enumerate(reader, start=2):
+            if not any(cell.strip() for cell in row):
+                continue
+            stats["rows"] += 1
+            try:
+                batch.append((line, _parse(row, columns)))
+            except ValueError as e:
+                _reject(stats, line, str(e))
+            if len(batch) >= batch_size:
+                _write_batch(batch, stats)
+                batch = []
+                if progress:
+                    progress(stats)
+    except (UnicodeDecodeError, csv.Error) as e:
+        if batch:
+            _write_batch(batch, stats)
+        stats["error"] = f"{reader.line_num + 1}행 근처에서 파일을 읽을 수 없습니다: {e}"
+        stats["elapsedSeconds"] = round(time.monotonic() - started, 3)
+        return stats
+    if batch:
+        _write_batch(batch, stats)
+        if progress:
+            progress(stats)
+
+    stats["elapsedSeconds"] = round(time.monotonic() - started, 3)
+    return stats
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+from attendances.importer import import_attendance_csv, BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = "나이스 등 학교 시스템에서 내보낸 출결 CSV를 배치 단위로 읽어 가져옵니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV 파일 경로")
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+        parser.add_argument('--encoding', default='utf-8-sig', help="예: utf-8-sig, cp949")
+
+    def handle(self, *args, **options):
+        def progress(stats):
+            self.stdout.write(
+                f"{stats['rows']}행 처리 (생성 {stats['created']}, 중복 {stats['duplicates']}, 거부 {stats['rejected']})"
+            )
+
+        try:
+            with open(options['path'], encoding=options['encoding'], newline='') as stream:
+                stats = import_attendance_csv(stream, max(1, options['batch_size']), progress)
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+
+        for rejected in stats["rejectedRows"]:
+            self.stdout.write(self.style.WARNING(f"{rejected['line']}행: {rejected['error']}"))
+        if "error" in stats:
+            raise CommandError(
+                f"{stats['error']} (중단 전까지 {stats['rows']}행 처리, 생성 {stats['created']}, "
+                f"중복 {stats['duplicates']}, 거부 {stats['rejected']})"
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f"출결 가져오기 완료: {stats['rows']}행, 생성 {stats['created']}, "
+            f"중복 {stats['duplicates']}, 거부 {stats['rejected']} ({stats['elapsedSeconds']}s)"
+        ))
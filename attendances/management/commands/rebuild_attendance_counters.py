@@ -0,0 +1,18 @@
+import time
+from django.core.management.base import BaseCommand
+from attendances.counters import rebuild_counters
+from attendances.calendars import rebuild_calendars
+
+
+class Command(BaseCommand):
+    help = "출결 원본 기록으로 학생/학년/연도별 유형·사유 집계와 출결 달력 비트맵을 처음부터 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--year', type=int, help="예: 2025")
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        rows = rebuild_counters(options['year'])
+        calendars = rebuild_calendars(options['year'])
+        self.stdout.write(f"집계 {rows}건, 달력 {calendars}건 ({time.monotonic() - started:.2f}s)")
+        self.stdout.write(self.style.SUCCESS("출결 집계 재생성 완료"))
@@ -0,0 +1,43 @@
+# Generated by Django 5.1.7 on 2026-10-18 20:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def build_attendance_counters(apps, schema_editor):
+    AttendanceRecord = apps.get_model('attendances', 'AttendanceRecord')
+    AttendanceCounter = apps.get_model('attendances', 'AttendanceCounter')
+
+    rows = AttendanceRecord.objects.values(
+        'student_id', 'grade', 'year', 'attendance_type', 'reason_type'
+    ).annotate(count=Count('id'))
+    AttendanceCounter.objects.bulk_create([AttendanceCounter(**row) for row in rows], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendances', '0001_initial'),
+        ('students', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('grade', models.CharField(max_length=10)),
+                ('year', models.IntegerField()),
+                ('attendance_type', models.CharField(choices=[('absence', '결석'), ('lateness', '지각'), ('earlyLeave', '조퇴'), ('result', '결과')], max_length=20)),
+                ('reason_type', models.CharField(choices=[('illness', '질병'), ('unauthorized', '미인정'), ('etc', '기타')], max_length=20)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='students.student')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['year', 'grade'], name='attendances_year_580ec6_idx')],
+                'unique_together': {('student', 'grade', 'year', 'attendance_type', 'reason_type')},
+            },
+        ),
+        migrations.RunPython(build_attendance_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-18 20:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendances', '0002_attendancecounter'),
+        ('students', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendancerecord',
+            index=models.Index(fields=['date', 'student'], name='attendances_date_9dd89b_idx'),
+        ),
+    ]
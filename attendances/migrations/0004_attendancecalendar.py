@@ -0,0 +1,57 @@
+# Generated by Django 5.1.7 on 2026-10-18 20:42
+
+import django.db.models.deletion
+from datetime import date
+from django.db import migrations, models
+
+
+def build_attendance_calendars(apps, schema_editor):
+    AttendanceRecord = apps.get_model('attendances', 'AttendanceRecord')
+    AttendanceCalendar = apps.get_model('attendances', 'AttendanceCalendar')
+
+    bitmaps = {}
+    for student_id, grade, year, attendance_type, day in AttendanceRecord.objects.values_list(
+        'student_id', 'grade', 'year', 'attendance_type', 'date'
+    ):
+        index = (day - date(year, 3, 1)).days
+        if not 0 <= index < (date(year + 1, 3, 1) - date(year, 3, 1)).days:
+            continue
+        key = (student_id, grade, year, attendance_type)
+        bitmaps[key] = bitmaps.get(key, 0) | (1 << index)
+
+    AttendanceCalendar.objects.bulk_create([
+        AttendanceCalendar(
+            student_id=student_id,
+            grade=grade,
+            year=year,
+            attendance_type=attendance_type,
+            days=bits.to_bytes(46, 'little')
+        )
+        for (student_id, grade, year, attendance_type), bits in bitmaps.items()
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendances', '0003_attendancerecord_attendances_date_9dd89b_idx'),
+        ('students', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceCalendar',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('grade', models.CharField(max_length=10)),
+                ('year', models.IntegerField()),
+                ('attendance_type', models.CharField(choices=[('absence', '결석'), ('lateness', '지각'), ('earlyLeave', '조퇴'), ('result', '결과')], max_length=20)),
+                ('days', models.BinaryField()),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='students.student')),
+            ],
+            options={
+                'unique_together': {('student', 'grade', 'year', 'attendance_type')},
+            },
+        ),
+        migrations.RunPython(build_attendance_calendars, migrations.RunPython.noop),
+    ]
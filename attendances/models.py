@@ -26,6 +26,7 @@ class AttendanceRecord(models.Model):
 
     class Meta:
         unique_together = ('student', 'grade', 'year', 'attendance_type', 'reason_type', 'date')
+        indexes = [models.Index(fields=['date', 'student'])]
 
 class AttendanceSummary(models.Model):
     student = models.ForeignKey(Student, on_delete=models.CASCADE)
@@ -37,3 +38,28 @@ class AttendanceSummary(models.Model):
 
     class Meta:
         unique_together = ('student', 'grade', 'year')
+
+
+class AttendanceCounter(models.Model):
+    student = models.ForeignKey(Student, on_delete=models.CASCADE)
+    grade = models.CharField(max_length=10)
+    year = models.IntegerField()
+    attendance_type = models.CharField(max_length=20, choices=AttendanceRecord.ATTENDANCE_TYPE_CHOICES)
+    reason_type = models.CharField(max_length=20, choices=AttendanceRecord.REASON_TYPE_CHOICES)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('student', 'grade', 'year', 'attendance_type', 'reason_type')
+        indexes = [models.Index(fields=['year', 'grade'])]
+
+
+class AttendanceCalendar(models.Model):
+    # 학년도(3월 1일 시작) 날짜별 비트, i번째 비트 = 3월 1일 + i일
+    student = models.ForeignKey(Student, on_delete=models.CASCADE)
+    grade = models.CharField(max_length=10)
+    year = models.IntegerField()
+    attendance_type = models.CharField(max_length=20, choices=AttendanceRecord.ATTENDANCE_TYPE_CHOICES)
+    days = models.BinaryField()
+
+    class Meta:
+        unique_together = ('student', 'grade', 'year', 'attendance_type')
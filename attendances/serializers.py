@@ -33,6 +33,7 @@ class AttendanceResponseSerializer(serializers.Serializer):
     year = serializers.IntegerField()
     homeTeacher = serializers.CharField(allow_null=True)
     totalDays = serializers.IntegerField()
+    attendanceRate = serializers.FloatField(allow_null=True)
     remarks = serializers.CharField(allow_null=True)
     attendance = AttendanceTypeStatSerializer()
     details = AttendanceGroupSerializer()
@@ -41,3 +42,42 @@ class AttendanceListResponseSerializer(serializers.Serializer):
     studentId = serializers.IntegerField()
     studentName = serializers.CharField()
     attendance = AttendanceResponseSerializer(many=True)
+
+class AttendanceRollCallSerializer(serializers.Serializer):
+    grade = serializers.IntegerField()
+    classNumber = serializers.IntegerField()
+    date = serializers.DateField()
+    year = serializers.IntegerField(required=False)
+    entries = serializers.ListField(child=serializers.DictField(), allow_empty=False)
+
+class AttendanceRollCallEntrySerializer(serializers.Serializer):
+    studentId = serializers.IntegerField()
+    attendanceType = serializers.ChoiceField(choices=AttendanceRecord.ATTENDANCE_TYPE_CHOICES)
+    reasonType = serializers.ChoiceField(choices=AttendanceRecord.REASON_TYPE_CHOICES)
+    reason = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+
+class AttendanceCorrectionChangeSerializer(serializers.Serializer):
+    attendanceType = serializers.ChoiceField(choices=AttendanceRecord.ATTENDANCE_TYPE_CHOICES, required=False)
+    reasonType = serializers.ChoiceField(choices=AttendanceRecord.REASON_TYPE_CHOICES, required=False)
+    reason = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+
+class AttendanceCorrectionSerializer(serializers.Serializer):
+    action = serializers.ChoiceField(choices=['delete', 'update'])
+    studentId = serializers.IntegerField(required=False)
+    grade = serializers.IntegerField(required=False)
+    classNumber = serializers.IntegerField(required=False)
+    year = serializers.IntegerField(required=False)
+    startDate = serializers.DateField()
+    endDate = serializers.DateField()
+    attendanceType = serializers.ChoiceField(choices=AttendanceRecord.ATTENDANCE_TYPE_CHOICES, required=False)
+    reasonType = serializers.ChoiceField(choices=AttendanceRecord.REASON_TYPE_CHOICES, required=False)
+    changes = AttendanceCorrectionChangeSerializer(required=False)
+
+    def validate(self, data):
+        if 'studentId' not in data and ('grade' not in data or 'classNumber' not in data):
+            raise serializers.ValidationError("studentId 또는 grade와 classNumber가 필요합니다.")
+        if data['startDate'] > data['endDate']:
+            raise serializers.ValidationError("startDate는 endDate보다 늦을 수 없습니다.")
+        if data['action'] == 'update' and not data.get('changes'):
+            raise serializers.ValidationError("update에는 changes가 필요합니다.")
+        return data
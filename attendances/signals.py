@@ -0,0 +1,66 @@
+import threading
+from contextlib import contextmanager
+from django.db.models.signals import post_init, post_save, post_delete
+from django.dispatch import receiver
+from schedules.signals import instructional_days_changed
+from .models import AttendanceRecord, AttendanceSummary
+from .counters import refresh_counters
+from .calendars import refresh_calendars
+
+
+# 여러 기록을 한꺼번에 지우거나 고칠 때는 집계/달력을 행마다 다시 쓰지 않고 마지막에 한번만 갱신
+_pending = threading.local()
+
+
+def refresh_keys(keys):
+    pending = getattr(_pending, "keys", None)
+    if pending is not None:
+        pending.update(keys)
+        return
+    refresh_counters(keys)
+    refresh_calendars(keys)
+
+
+@contextmanager
+def deferred_refresh():
+    if getattr(_pending, "keys", None) is not None:
+        yield
+        return
+    keys = _pending.keys = set()
+    try:
+        yield
+    finally:
+        _pending.keys = None
+    if keys:
+        refresh_counters(keys)
+        refresh_calendars(keys)
+
+
+def _counter_key(instance):
+    values = instance.__dict__
+    return values.get('student_id'), values.get('grade'), values.get('year')
+
+
+@receiver(post_init, sender=AttendanceRecord)
+def remember_counter_key(sender, instance, **kwargs):
+    instance._counter_key = _counter_key(instance) if instance.pk else None
+
+
+@receiver(post_save, sender=AttendanceRecord)
+def sync_saved_record(sender, instance, **kwargs):
+    keys = {_counter_key(instance)}
+    if instance._counter_key:
+        keys.add(instance._counter_key)
+    instance._counter_key = _counter_key(instance)
+    refresh_keys(keys)
+
+
+@receiver(post_delete, sender=AttendanceRecord)
+def sync_deleted_record(sender, instance, **kwargs):
+    refresh_keys({_counter_key(instance)})
+
+
+@receiver(instructional_days_changed)
+def sync_summary_total_days(sender, year, previous_total, total, **kwargs):
+    # 직접 입력한 수업일수는 두고, 비어 있거나 이전 학사일정 값인 요약만 갱신
+    AttendanceSummary.objects.filter(year=year, total_days__in={0, previous_total}).update(total_days=total)
@@ -3,4 +3,10 @@ from . import views
 
 urlpatterns = [
     path('students/<int:student_id>', views.AttendanceView.as_view(), name='attendance-manage'),
+    path('students/<int:student_id>/calendar', views.AttendanceCalendarView.as_view(), name='attendance-calendar'),
+    path('roll-call', views.AttendanceRollCallView.as_view(), name='attendance-roll-call'),
+    path('corrections', views.AttendanceCorrectionView.as_view(), name='attendance-corrections'),
+    path('import', views.AttendanceImportView.as_view(), name='attendance-import'),
+    path('dashboard/classroom', views.ClassroomAttendanceDashboardView.as_view(), name='attendance-classroom-dashboard'),
+    path('dashboard/grade', views.GradeAttendanceDashboardView.as_view(), name='attendance-grade-dashboard'),
 ]
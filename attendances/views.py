@@ -2,14 +2,24 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from django.shortcuts import get_object_or_404
-from .models import AttendanceRecord, AttendanceSummary
+from .models import AttendanceRecord, AttendanceSummary, AttendanceCounter
+from .counters import ATTENDANCE_TYPES, REASON_TYPES, refresh_counters, counter_stats
+from .dashboard import build_dashboard, classroom_totals
+from .calendars import refresh_calendars, student_calendars, school_year
+from .importer import import_attendance_csv, API_MAX_BYTES
+from .corrections import correct_records
+from schedules.days import total_days as instructional_days
+from .serializers import AttendanceRollCallSerializer, AttendanceRollCallEntrySerializer, AttendanceCorrectionSerializer
 from students.models import Student
-from .serializers import AttendanceListResponseSerializer
+from classrooms.models import Classroom
+from utils.reference_cache import get_classroom_id
+from django.db import transaction
 from django.db.models import Q
 from collections import defaultdict
+import io
 from rest_framework.permissions import IsAuthenticated
 from utils.slack import send_success_slack, send_error_slack
-from datetime import datetime
+from datetime import datetime, date as date_type
 
 class AttendanceView(APIView):
     permission_classes = [IsAuthenticated]
@@ -20,40 +30,49 @@ class AttendanceView(APIView):
             grade = request.GET.get("grade")
             year = request.GET.get("year")
 
-            student = get_object_or_404(Student, id=student_id)
+            student = get_object_or_404(Student.objects.select_related('user'), id=student_id)
             summaries = AttendanceSummary.objects.filter(student=student)
+            records = AttendanceRecord.objects.filter(student=student)
+            counters = AttendanceCounter.objects.filter(student=student)
 
             if grade and year:
                 summaries = summaries.filter(grade=grade, year=year)
+                records = records.filter(grade=grade, year=year)
+                counters = counters.filter(grade=grade, year=year)
 
-            attendance_data = []
-            for summary in summaries:
-                records = AttendanceRecord.objects.filter(
-                    student=student,
-                    grade=summary.grade,
-                    year=summary.year
-                )
-
-                stat = defaultdict(lambda: {"illness": 0, "unauthorized": 0, "etc": 0})
-                detail = defaultdict(lambda: defaultdict(list))
+            # 유형 × 사유 건수는 쓰기 시점에 유지되는 집계 테이블에서 읽음
+            stats = counter_stats(counters)
 
-                for record in records:
-                    typ = record.attendance_type
-                    reason = record.reason_type
-                    stat[typ][reason] += 1
-                    detail[typ][reason].append({
-                        "date": record.date,
-                        "reason": record.reason or ""
-                    })
+            details = defaultdict(list)
+            for record_grade, record_year, typ, reason, date, text in records.order_by('date', 'id').values_list(
+                'grade', 'year', 'attendance_type', 'reason_type', 'date', 'reason'
+            ):
+                details[(record_grade, record_year, typ, reason)].append({
+                    "date": date.isoformat(),
+                    "reason": text or ""
+                })
 
+            attendance_data = []
+            for summary in summaries.order_by('id'):
+                key = (summary.grade, summary.year)
+                stat = stats.get(key) or {
+                    typ: dict.fromkeys(REASON_TYPES, 0) for typ in ATTENDANCE_TYPES
+                }
+                absences = sum(stat["absence"].values())
                 attendance_data.append({
                     "grade": summary.grade,
                     "year": summary.year,
                     "homeTeacher": summary.home_teacher,
                     "totalDays": summary.total_days,
+                    "attendanceRate": round(
+                        (summary.total_days - absences) / summary.total_days * 100, 1
+                    ) if summary.total_days else None,
                     "remarks": summary.remarks,
                     "attendance": stat,
-                    "details": detail
+                    "details": {
+                        typ: {reason: details.get((*key, typ, reason), []) for reason in REASON_TYPES}
+                        for typ in ATTENDANCE_TYPES
+                    }
                 })
 
             res = {
@@ -62,9 +81,8 @@ class AttendanceView(APIView):
                 "attendance": attendance_data
             }
 
-            serializer = AttendanceListResponseSerializer(res)
             send_success_slack(request, "출결 조회", start_time)
-            return Response(serializer.data)
+            return Response(res)
 
         except Exception as e:
             send_error_slack(request, "출결 조회", start_time)
@@ -76,26 +94,28 @@ class AttendanceView(APIView):
             data = request.data
             student = get_object_or_404(Student, id=student_id)
 
-            AttendanceSummary.objects.get_or_create(
-                student=student,
-                grade=data["grade"],
-                year=data["year"],
-                defaults={
-                    "total_days": 0,
-                    "remarks": "",
-                    "home_teacher": data.get("homeTeacher", "")
-                }
-            )
+            # 기록과 집계/달력 갱신(시그널)을 한 트랜잭션으로 처리
+            with transaction.atomic():
+                AttendanceSummary.objects.get_or_create(
+                    student=student,
+                    grade=data["grade"],
+                    year=data["year"],
+                    defaults={
+                        "total_days": instructional_days(int(data["year"])),
+                        "remarks": "",
+                        "home_teacher": data.get("homeTeacher", "")
+                    }
+                )
 
-            AttendanceRecord.objects.create(
-                student=student,
-                grade=data["grade"],
-                year=data["year"],
-                attendance_type=data["attendanceType"],
-                reason_type=data["reasonType"],
-                date=data["date"],
-                reason=data.get("reason", "")
-            )
+                AttendanceRecord.objects.create(
+                    student=student,
+                    grade=data["grade"],
+                    year=data["year"],
+                    attendance_type=data["attendanceType"],
+                    reason_type=data["reasonType"],
+                    date=data["date"],
+                    reason=data.get("reason", "")
+                )
             send_success_slack(request, "출결 등록", start_time)
             return Response({"message": "Attendance record added successfully"}, status=201)
 
@@ -109,14 +129,15 @@ class AttendanceView(APIView):
             data = request.data
             student = get_object_or_404(Student, id=student_id)
 
-            deleted, _ = AttendanceRecord.objects.filter(
-                student=student,
-                grade=data["grade"],
-                year=data["year"],
-                attendance_type=data["attendanceType"],
-                reason_type=data["reasonType"],
-                date=data["date"]
-            ).delete()
+            with transaction.atomic():
+                deleted, _ = AttendanceRecord.objects.filter(
+                    student=student,
+                    grade=data["grade"],
+                    year=data["year"],
+                    attendance_type=data["attendanceType"],
+                    reason_type=data["reasonType"],
+                    date=data["date"]
+                ).delete()
 
             if deleted:
                 send_success_slack(request, "출결 삭제", start_time)
@@ -128,3 +149,267 @@ class AttendanceView(APIView):
         except Exception as e:
             send_error_slack(request, "출결 삭제", start_time)
             return Response({"error": str(e)}, status=500)
+
+
+class AttendanceRollCallView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        start_time = datetime.now()
+        try:
+            serializer = AttendanceRollCallSerializer(data=request.data)
+            if not serializer.is_valid():
+                send_error_slack(request, "출결 일괄 등록", start_time)
+                return Response({"error": "Invalid input", "details": serializer.errors}, status=400)
+            data = serializer.validated_data
+
+            classroom_id = get_classroom_id(data['grade'], data['classNumber'])
+            if classroom_id is None:
+                send_error_slack(request, "출결 일괄 등록", start_time)
+                return Response({"error": "해당 반이 존재하지 않습니다."}, status=404)
+            classroom = Classroom.objects.select_related('teacher__user').get(id=classroom_id)
+
+            grade = str(data['grade'])
+            year = data.get('year') or school_year(data['date'])
+            date = data['date']
+
+            entries = []
+            for item in data['entries']:
+                entry_serializer = AttendanceRollCallEntrySerializer(data=item)
+                if entry_serializer.is_valid():
+                    entries.append((entry_serializer.validated_data, None))
+                else:
+                    entries.append((None, entry_serializer.errors))
+
+            valid = [entry for entry, _ in entries if entry is not None]
+            students = set(Student.objects.filter(
+                classroom_id=classroom_id, id__in={entry['studentId'] for entry in valid}
+            ).values_list('id', flat=True))
+            existing = set(AttendanceRecord.objects.filter(
+                student_id__in=students, grade=grade, year=year, date=date
+            ).values_list('student_id', 'attendance_type', 'reason_type'))
+
+            results = []
+            records = []
+            for index, (entry, errors) in enumerate(entries, start=1):
+                if entry is None:
+                    results.append({"index": index, "status": "invalid", "errors": errors})
+                    continue
+                result = {
+                    "index": index,
+                    "studentId": entry['studentId'],
+                    "attendanceType": entry['attendanceType'],
+                    "reasonType": entry['reasonType']
+                }
+                key = (entry['studentId'], entry['attendanceType'], entry['reasonType'])
+                if entry['studentId'] not in students:
+                    result.update(status="invalid", errors={"studentId": ["해당 반의 학생이 아닙니다."]})
+                elif key in existing:
+                    result["status"] = "duplicate"
+                else:
+                    existing.add(key)
+                    result["status"] = "created"
+                    records.append(AttendanceRecord(
+                        student_id=entry['studentId'],
+                        grade=grade,
+                        year=year,
+                        date=date,
+                        attendance_type=entry['attendanceType'],
+                        reason_type=entry['reasonType'],
+                        reason=entry.get('reason') or ""
+                    ))
+                results.append(result)
+
+            home_teacher = classroom.teacher.user.name if classroom.teacher else ""
+            with transaction.atomic():
+                # 동시에 같은 출결이 들어와도 unique_together 충돌은 무시
+                AttendanceRecord.objects.bulk_create(records, ignore_conflicts=True)
+                # bulk_create는 시그널을 보내지 않으므로 출결 집계를 직접 갱신
+                keys = {(record.student_id, grade, year) for record in records}
+                refresh_counters(keys)
+                refresh_calendars(keys)
+                AttendanceSummary.objects.bulk_create([
+                    AttendanceSummary(
+                        student_id=student_id,
+                        grade=grade,
+                        year=year,
+                        total_days=instructional_days(year),
+                        remarks="",
+                        home_teacher=home_teacher
+                    )
+                    for student_id in {record.student_id for record in records}
+                ], ignore_conflicts=True)
+
+            counts = {key: sum(1 for r in results if r["status"] == key) for key in ("created", "duplicate", "invalid")}
+            send_success_slack(request, "출결 일괄 등록", start_time)
+            return Response({
+                "grade": grade,
+                "year": year,
+                "date": date,
+                **counts,
+                "results": results
+            }, status=201 if records else 200)
+        except Exception as e:
+            send_error_slack(request, "출결 일괄 등록", start_time)
+            return Response({"error": str(e)}, status=500)
+
+
+def parse_date_range(request):
+    try:
+        start = date_type.fromisoformat(request.query_params.get("start", ""))
+        end = date_type.fromisoformat(request.query_params.get("end", ""))
+    except ValueError:
+        return None
+    return (start, end) if start <= end else None
+
+
+class ClassroomAttendanceDashboardView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        start_time = datetime.now()
+        try:
+            date_range = parse_date_range(request)
+            if date_range is None:
+                send_error_slack(request, "반 출결 현황 조회", start_time)
+                return Response({"error": "start, end는 YYYY-MM-DD 형식이어야 합니다."}, status=400)
+
+            classroom_id = get_classroom_id(request.query_params.get("grade"), request.query_params.get("class"))
+            if classroom_id is None:
+                send_error_slack(request, "반 출결 현황 조회", start_time)
+                return Response({"error": "해당 반이 존재하지 않습니다."}, status=404)
+
+            data = build_dashboard(Student.objects.filter(classroom_id=classroom_id), *date_range)
+            send_success_slack(request, "반 출결 현황 조회", start_time)
+            return Response(data)
+        except Exception as e:
+            send_error_slack(request, "반 출결 현황 조회", start_time)
+            return Response({"error": str(e)}, status=500)
+
+
+class GradeAttendanceDashboardView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        start_time = datetime.now()
+        try:
+            date_range = parse_date_range(request)
+            grade = request.query_params.get("grade")
+            if date_range is None or not grade or not grade.isdigit():
+                send_error_slack(request, "학년 출결 현황 조회", start_time)
+                return Response({"error": "grade와 start, end(YYYY-MM-DD)가 필요합니다."}, status=400)
+
+            data = build_dashboard(Student.objects.filter(classroom__grade=int(grade)), *date_range)
+            data["classrooms"] = classroom_totals(data)
+            send_success_slack(request, "학년 출결 현황 조회", start_time)
+            return Response(data)
+        except Exception as e:
+            send_error_slack(request, "학년 출결 현황 조회", start_time)
+            return Response({"error": str(e)}, status=500)
+
+
+class AttendanceCalendarView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, student_id):
+        start_time = datetime.now()
+        try:
+            student = get_object_or_404(Student, id=student_id)
+            date_range = None
+            if request.query_params.get("start") or request.query_params.get("end"):
+                date_range = parse_date_range(request)
+                if date_range is None:
+                    send_error_slack(request, "출결 달력 조회", start_time)
+                    return Response({"error": "start, end는 YYYY-MM-DD 형식이어야 합니다."}, status=400)
+
+            calendars = student_calendars(
+                student,
+                grade=request.query_params.get("grade"),
+                year=request.query_params.get("year"),
+                start=date_range[0] if date_range else None,
+                end=date_range[1] if date_range else None
+            )
+            send_success_slack(request, "출결 달력 조회", start_time)
+            return Response({"studentId": student.id, "calendars": calendars})
+        except Exception as e:
+            send_error_slack(request, "출결 달력 조회", start_time)
+            return Response({"error": str(e)}, status=500)
+
+
+class AttendanceImportView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        start_time = datetime.now()
+        try:
+            upload = request.FILES.get("file")
+            if not upload:
+                send_error_slack(request, "출결 CSV 가져오기", start_time)
+                return Response({"error": "file이 필요합니다."}, status=400)
+
+            if upload.size > API_MAX_BYTES:
+                send_error_slack(request, "출결 CSV 가져오기", start_time)
+                return Response({
+                    "error": f"{API_MAX_BYTES // (1024 * 1024)}MB를 넘는 파일은 import_attendance_csv 명령으로 가져와야 합니다."
+                }, status=413)
+
+            encoding = request.data.get("encoding") or "utf-8-sig"
+            try:
+                stats = import_attendance_csv(io.TextIOWrapper(upload.file, encoding=encoding, newline=''))
+            except (ValueError, LookupError) as e:
+                send_error_slack(request, "출결 CSV 가져오기", start_time)
+                return Response({"error": str(e)}, status=400)
+
+            if "error" in stats:
+                # 앞 배치는 이미 반영되었으므로 반영된 건수를 함께 돌려줌
+                send_error_slack(request, "출결 CSV 가져오기", start_time)
+                return Response(stats, status=400)
+
+            send_success_slack(request, "출결 CSV 가져오기", start_time)
+            return Response(stats, status=201 if stats["created"] else 200)
+        except Exception as e:
+            send_error_slack(request, "출결 CSV 가져오기", start_time)
+            return Response({"error": str(e)}, status=500)
+
+
+class AttendanceCorrectionView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        start_time = datetime.now()
+        try:
+            serializer = AttendanceCorrectionSerializer(data=request.data)
+            if not serializer.is_valid():
+                send_error_slack(request, "출결 일괄 정정", start_time)
+                return Response({"error": "Invalid input", "details": serializer.errors}, status=400)
+            data = serializer.validated_data
+
+            condition = Q(date__range=(data['startDate'], data['endDate']))
+            if 'studentId' in data:
+                condition &= Q(student_id=get_object_or_404(Student, id=data['studentId']).id)
+            else:
+                classroom_id = get_classroom_id(data['grade'], data['classNumber'])
+                if classroom_id is None:
+                    send_error_slack(request, "출결 일괄 정정", start_time)
+                    return Response({"error": "해당 반이 존재하지 않습니다."}, status=404)
+                condition &= Q(student__classroom_id=classroom_id)
+            if 'grade' in data:
+                condition &= Q(grade=str(data['grade']))
+            if 'year' in data:
+                condition &= Q(year=data['year'])
+            if 'attendanceType' in data:
+                condition &= Q(attendance_type=data['attendanceType'])
+            if 'reasonType' in data:
+                condition &= Q(reason_type=data['reasonType'])
+
+            changes = None
+            if data['action'] == 'update':
+                fields = {"attendanceType": "attendance_type", "reasonType": "reason_type", "reason": "reason"}
+                changes = {field: data['changes'][key] for key, field in fields.items() if key in data['changes']}
+
+            result = correct_records(condition, changes)
+            send_success_slack(request, "출결 일괄 정정", start_time)
+            return Response({"action": data['action'], **result})
+        except Exception as e:
+            send_error_slack(request, "출결 일괄 정정", start_time)
+            return Response({"error": str(e)}, status=500)
@@ -0,0 +1,10 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from utils import reference_cache
+from .models import Classroom
+
+
+@receiver(post_save, sender=Classroom)
+@receiver(post_delete, sender=Classroom)
+def invalidate_reference_cache(sender, instance, **kwargs):
+    reference_cache.invalidate()
@@ -34,6 +34,7 @@ INSTALLED_APPS = [
     'notifications',
     'reports',
     'classrooms',
+    'schedules',
     'rest_framework_simplejwt.token_blacklist',
     'django.contrib.admin',
     'django.contrib.auth',
@@ -93,6 +94,21 @@ DATABASES = {
     }
 }
 
+# Cache
+# 등수/기준 데이터/상담 가능 시간 캐시의 버전 키를 gunicorn 워커와 관리 명령이 함께 봐야 하므로
+# 프로세스별 LocMemCache 대신 공유 캐시를 사용 (기본 DB 캐시, CACHE_BACKEND로 Redis 등 지정 가능)
+# DB 캐시 테이블은 마이그레이션이 아닌 배포 단계에서 `python manage.py createcachetable` 로 생성
+
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.db.DatabaseCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'django_cache'),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', '10000')),
+        },
+    }
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -131,6 +147,8 @@ STATIC_URL = '/static/'
 
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
+REPORT_CARD_ROOT = os.environ.get('REPORT_CARD_ROOT', os.path.join(BASE_DIR, 'report_cards'))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
@@ -29,6 +29,7 @@ urlpatterns = [
     path('api/attendances/', include('attendances.urls')),
     path('api/notifications/', include('notifications.urls')),
     path('api/reports/', include('reports.urls')),
+    path('api/schedules/', include('schedules.urls')),
 
     path('healthz/', lambda request: JsonResponse({"status": "ok"})),
 ]
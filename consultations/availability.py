@@ -0,0 +1,193 @@
+import threading
+import time
+from bisect import bisect_right
+from datetime import timedelta
+from django.core.cache import cache
+from schedules.days import holidays_between
+from .models import Counseling, OfficeHour, BlockedPeriod
+
+# 교사 시간표가 없을 때 쓰는 기본 상담 시간대 (30분 단위, 매일)
+COUNSELING_TIMES = [
+    "09:00", "09:30", "10:00", "10:30", "11:00", "11:30",
+    "13:00", "13:30", "14:00", "14:30", "15:00", "15:30",
+    "16:00", "16:30", "17:00"
+]
+SLOT_MINUTES = 30
+MAX_RANGE_DAYS = 92
+SLOTS_TIMEOUT = 60 * 60
+# 교사별 공유 버전은 이 간격으로만 다시 확인 (같은 프로세스의 변경은 invalidate_teacher()가 바로 반영)
+VERSION_RECHECK_SECONDS = 5
+
+_versions_lock = threading.Lock()
+_versions = {}
+
+
+def _minutes(value):
+    return value.hour * 60 + value.minute
+
+
+def _label(minutes):
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+DEFAULT_SLOTS = [
+    (start, start + SLOT_MINUTES) for start in (int(t[:2]) * 60 + int(t[3:]) for t in COUNSELING_TIMES)
+]
+
+
+def weekday_slots(office_hours):
+    # office_hours: [(요일, 시작 분, 종료 분, 슬롯 길이)] -> {요일: [(시작 분, 종료 분)]}
+    if not office_hours:
+        return {weekday: DEFAULT_SLOTS for weekday in range(7)}
+    candidates = {}
+    for weekday, start, end, length in office_hours:
+        candidates.setdefault(weekday, []).extend(
+            (minute, minute + length) for minute in range(start, end - length + 1, length)
+        )
+    slots = {}
+    for weekday, items in candidates.items():
+        # 겹치는 시간대는 먼저 시작하는 슬롯만 남김
+        kept = slots.setdefault(weekday, [])
+        for start, end in sorted(items):
+            if not kept or start >= kept[-1][1]:
+                kept.append((start, end))
+    return slots
+
+
+def expand_slots(office_hours, blocked, start, end):
+    # 반복 시간표를 start~end 날짜별 슬롯으로 펼치고, 막힌 기간과 겹치는 슬롯은 뺌
+    # blocked: [(시작일, 종료일, 시작 분 또는 None, 종료 분 또는 None)]
+    by_weekday = weekday_slots(office_hours)
+    days = {}
+    day = start
+    while day <= end:
+        slots = by_weekday.get(day.weekday(), [])
+        for first, last, block_start, block_end in blocked:
+            if not first <= day <= last:
+                continue
+            if block_start is None:
+                slots = []
+                break
+            slots = [(s, e) for s, e in slots if e <= block_start or s >= block_end]
+        days[day] = slots
+        day += timedelta(days=1)
+    return days
+
+
+def slot_index(slots, value):
+    # 슬롯 중간에 잡힌 상담은 그 슬롯을 차지한 것으로 봄
+    minutes = _minutes(value)
+    index = bisect_right([start for start, _ in slots], minutes) - 1
+    if index < 0 or minutes >= slots[index][1]:
+        return None
+    return index
+
+
+def slot_times(slots, mask):
+    return [_label(start) for index, (start, _) in enumerate(slots) if (mask >> index) & 1]
+
+
+def _version_key(teacher_id):
+    return f"consultations:teacher:{teacher_id}:version"
+
+
+def teacher_version(teacher_id):
+    local = _versions.get(teacher_id)
+    if local is not None and time.monotonic() - local[1] < VERSION_RECHECK_SECONDS:
+        return local[0]
+    key = _version_key(teacher_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    with _versions_lock:
+        _versions[teacher_id] = (version, time.monotonic())
+    return version
+
+
+def invalidate_teacher(teacher_id):
+    cache.set(_version_key(teacher_id), time.time_ns(), None)
+    with _versions_lock:
+        _versions.pop(teacher_id, None)
+
+
+def _month_key(teacher_id, month, version):
+    return f"consultations:slots:{teacher_id}:{month:%Y-%m}:{version}"
+
+
+def _months(start, end):
+    month = start.replace(day=1)
+    while month <= end:
+        yield month
+        month = (month + timedelta(days=32)).replace(day=1)
+
+
+def _load_months(teacher_id, months):
+    first = months[0]
+    last = (months[-1] + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    office_hours = [
+        (weekday, _minutes(start), _minutes(end), length)
+        for weekday, start, end, length in OfficeHour.objects.filter(teacher_id=teacher_id).values_list(
+            'weekday', 'start_time', 'end_time', 'slot_minutes'
+        )
+    ]
+    blocked = [
+        (start_date, end_date, _minutes(start) if start else None, _minutes(end) if end else None)
+        for start_date, end_date, start, end in BlockedPeriod.objects.filter(
+            teacher_id=teacher_id, start_date__lte=last, end_date__gte=first
+        ).values_list('start_date', 'end_date', 'start_time', 'end_time')
+    ]
+    days = expand_slots(office_hours, blocked, first, last)
+    masks = {}
+    for day, value in Counseling.objects.filter(
+        teacher_id=teacher_id,
+        status='예약확정',
+        counseling_date__gte=first,
+        counseling_date__lte=last
+    ).values_list('counseling_date', 'counseling_time'):
+        index = slot_index(days[day], value)
+        if index is not None:
+            masks[day] = masks.get(day, 0) | (1 << index)
+
+    loaded = {month: {} for month in months}
+    for day, slots in days.items():
+        month_days = loaded.get(day.replace(day=1))
+        if month_days is not None:
+            month_days[day] = (slots, masks.get(day, 0))
+    return loaded
+
+
+def month_slots(teacher_id, start, end):
+    # {날짜: (슬롯 목록, 예약된 슬롯 비트마스크)}, 교사/월 단위로 캐시하고 없는 달만 한 번에 계산
+    version = teacher_version(teacher_id)
+    keys = {_month_key(teacher_id, month, version): month for month in _months(start, end)}
+    cached = cache.get_many(keys)
+    missing = [month for key, month in keys.items() if key not in cached]
+
+    days = {}
+    for month_days in cached.values():
+        days.update(month_days)
+    if missing:
+        loaded = _load_months(teacher_id, missing)
+        cache.set_many({_month_key(teacher_id, month, version): month_days for month, month_days in loaded.items()}, SLOTS_TIMEOUT)
+        for month_days in loaded.values():
+            days.update(month_days)
+    return {day: value for day, value in days.items() if start <= day <= end}
+
+
+def availability(teacher_id, start, end):
+    days = month_slots(teacher_id, start, end)
+    holidays = set(holidays_between(start, end))
+    result = []
+    for day in sorted(days):
+        slots, mask = days[day]
+        free = 0 if day in holidays else ((1 << len(slots)) - 1) & ~mask
+        result.append({
+            "date": day.strftime('%Y-%m-%d'),
+            "isHoliday": day in holidays,
+            "times": slot_times(slots, (1 << len(slots)) - 1),
+            "bookedMask": mask,
+            "availableTimes": slot_times(slots, free),
+            "bookedTimes": slot_times(slots, mask)
+        })
+    return result
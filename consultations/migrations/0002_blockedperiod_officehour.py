@@ -0,0 +1,44 @@
+# Generated by Django 5.1.7 on 2026-10-18 21:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultations', '0001_initial'),
+        ('teachers', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BlockedPeriod',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField()),
+                ('start_time', models.TimeField(blank=True, null=True)),
+                ('end_time', models.TimeField(blank=True, null=True)),
+                ('reason', models.CharField(blank=True, max_length=100, null=True)),
+                ('teacher', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='blocked_periods', to='teachers.teacher')),
+            ],
+            options={
+                'ordering': ['start_date', 'start_time'],
+            },
+        ),
+        migrations.CreateModel(
+            name='OfficeHour',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weekday', models.IntegerField(choices=[(0, '월'), (1, '화'), (2, '수'), (3, '목'), (4, '금'), (5, '토'), (6, '일')])),
+                ('start_time', models.TimeField()),
+                ('end_time', models.TimeField()),
+                ('slot_minutes', models.PositiveIntegerField(default=30)),
+                ('teacher', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='office_hours', to='teachers.teacher')),
+            ],
+            options={
+                'ordering': ['weekday', 'start_time'],
+            },
+        ),
+    ]
@@ -37,3 +37,36 @@ class Counseling(models.Model):
 
     class Meta:
         ordering = ['-counseling_date', '-counseling_time']
+
+class OfficeHour(models.Model):
+    # 요일별 반복 상담 가능 시간, 교사에게 하나도 없으면 기본 시간표를 사용
+    WEEKDAY_CHOICES = [
+        (0, '월'),
+        (1, '화'),
+        (2, '수'),
+        (3, '목'),
+        (4, '금'),
+        (5, '토'),
+        (6, '일'),
+    ]
+
+    teacher = models.ForeignKey(Teacher, on_delete=models.CASCADE, related_name='office_hours')
+    weekday = models.IntegerField(choices=WEEKDAY_CHOICES)
+    start_time = models.TimeField()
+    end_time = models.TimeField()
+    slot_minutes = models.PositiveIntegerField(default=30)
+
+    class Meta:
+        ordering = ['weekday', 'start_time']
+
+class BlockedPeriod(models.Model):
+    # 시간을 비워두면 해당 날짜 전체를 막음
+    teacher = models.ForeignKey(Teacher, on_delete=models.CASCADE, related_name='blocked_periods')
+    start_date = models.DateField()
+    end_date = models.DateField()
+    start_time = models.TimeField(blank=True, null=True)
+    end_time = models.TimeField(blank=True, null=True)
+    reason = models.CharField(max_length=100, blank=True, null=True)
+
+    class Meta:
+        ordering = ['start_date', 'start_time']
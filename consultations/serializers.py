@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Counseling
+from .models import Counseling, OfficeHour, BlockedPeriod
 from students.models import Student
 from teachers.models import Teacher
 
@@ -180,3 +180,42 @@ class CounselingUpdateSerializer(serializers.ModelSerializer):
             'counselingDate', 'counselingTime', 'location', 'status',
             'resultContent', 'requestContent'
         ]
+
+
+class OfficeHourSerializer(serializers.ModelSerializer):
+    startTime = serializers.TimeField(source='start_time', format='%H:%M')
+    endTime = serializers.TimeField(source='end_time', format='%H:%M')
+    slotMinutes = serializers.IntegerField(source='slot_minutes', min_value=10, max_value=180, required=False)
+
+    class Meta:
+        model = OfficeHour
+        fields = ['weekday', 'startTime', 'endTime', 'slotMinutes']
+
+    def validate(self, attrs):
+        start = attrs['start_time'].hour * 60 + attrs['start_time'].minute
+        end = attrs['end_time'].hour * 60 + attrs['end_time'].minute
+        if end - start < attrs.get('slot_minutes', 30):
+            raise serializers.ValidationError("endTime은 startTime보다 슬롯 길이 이상 늦어야 합니다.")
+        return attrs
+
+
+class BlockedPeriodSerializer(serializers.ModelSerializer):
+    startDate = serializers.DateField(source='start_date')
+    endDate = serializers.DateField(source='end_date')
+    startTime = serializers.TimeField(source='start_time', format='%H:%M', required=False, allow_null=True)
+    endTime = serializers.TimeField(source='end_time', format='%H:%M', required=False, allow_null=True)
+    reason = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+
+    class Meta:
+        model = BlockedPeriod
+        fields = ['id', 'startDate', 'endDate', 'startTime', 'endTime', 'reason']
+
+    def validate(self, attrs):
+        if attrs['start_date'] > attrs['end_date']:
+            raise serializers.ValidationError("startDate는 endDate보다 늦을 수 없습니다.")
+        start, end = attrs.get('start_time'), attrs.get('end_time')
+        if (start is None) != (end is None):
+            raise serializers.ValidationError("startTime과 endTime은 함께 입력해야 합니다.")
+        if start is not None and start >= end:
+            raise serializers.ValidationError("startTime은 endTime보다 빨라야 합니다.")
+        return attrs
@@ -0,0 +1,30 @@
+from django.db.models.signals import post_init, post_save, post_delete
+from django.dispatch import receiver
+from .models import Counseling, OfficeHour, BlockedPeriod
+from .availability import invalidate_teacher
+
+
+@receiver(post_init, sender=Counseling)
+def remember_teacher(sender, instance, **kwargs):
+    instance._availability_teacher = instance.__dict__.get('teacher_id') if instance.pk else None
+
+
+@receiver(post_save, sender=Counseling)
+def sync_saved_counseling(sender, instance, **kwargs):
+    # 신청/승인/일정 변경 모두 예약 현황에 영향을 줄 수 있으므로 교사 단위로 무효화
+    for teacher_id in {instance.teacher_id, instance._availability_teacher} - {None}:
+        invalidate_teacher(teacher_id)
+    instance._availability_teacher = instance.teacher_id
+
+
+@receiver(post_delete, sender=Counseling)
+def sync_deleted_counseling(sender, instance, **kwargs):
+    invalidate_teacher(instance.teacher_id)
+
+
+@receiver(post_save, sender=OfficeHour)
+@receiver(post_delete, sender=OfficeHour)
+@receiver(post_save, sender=BlockedPeriod)
+@receiver(post_delete, sender=BlockedPeriod)
+def sync_teacher_template(sender, instance, **kwargs):
+    invalidate_teacher(instance.teacher_id)
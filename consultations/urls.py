@@ -6,6 +6,10 @@ urlpatterns = [
     path('teacher/<int:teacher_id>/requests', views.TeacherCounselingRequestListView.as_view()),
     path('teacher/<int:teacher_id>/scheduled', views.TeacherScheduledCounselingListView.as_view()),
     path('teacher/<int:teacher_id>/calendar', views.TeacherCounselingCalendarView.as_view()),
+    path('teacher/<int:teacher_id>/availability', views.TeacherCounselingAvailabilityView.as_view()),
+    path('teacher/<int:teacher_id>/office-hours', views.TeacherOfficeHourView.as_view()),
+    path('teacher/<int:teacher_id>/blocked-periods', views.TeacherBlockedPeriodView.as_view()),
+    path('blocked-periods/<int:blocked_id>', views.BlockedPeriodDeleteView.as_view()),
     path('available-times', views.AvailableCounselingTimesView.as_view()),
     path('request', views.CounselingRequestCreateView.as_view()),
     path('<int:counseling_id>/approve', views.CounselingApproveView.as_view()),
@@ -1,13 +1,16 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from .models import Counseling
-from .serializers import CounselingSerializer, CounselingRequestSerializer, CounselingApproveSerializer, CounselingUpdateSerializer, TeacherCounselingRequestSerializer, TeacherScheduledCounselingSerializer
+from .models import Counseling, BlockedPeriod
+from .serializers import OfficeHourSerializer, BlockedPeriodSerializer, CounselingSerializer, CounselingRequestSerializer, CounselingApproveSerializer, CounselingUpdateSerializer, TeacherCounselingRequestSerializer, TeacherScheduledCounselingSerializer
 from students.models import Student
 from rest_framework.permissions import IsAuthenticated
-from datetime import datetime
+from datetime import datetime, timedelta
+from django.db import transaction
 from teachers.models import Teacher
 from utils.slack import send_success_slack, send_error_slack
+from schedules.days import holidays_between
+from .availability import MAX_RANGE_DAYS, availability, month_slots, slot_times, invalidate_teacher
 from datetime import datetime
 
 class StudentCounselingListView(APIView):
@@ -126,12 +129,6 @@ class TeacherCounselingCalendarView(APIView):
                 counseling_date__month=month
             )
 
-            available_times = [
-                "09:00", "09:30", "10:00", "10:30", "11:00", "11:30",
-                "13:00", "13:30", "14:00", "14:30", "15:00", "15:30",
-                "16:00", "16:30", "17:00"
-            ]
-
             booked_slots = {}
             counselings_data = []
 
@@ -148,12 +145,21 @@ class TeacherCounselingCalendarView(APIView):
                     "status": c.status
                 })
 
+            first_day = datetime(int(year), int(month), 1).date()
+            last_day = datetime(int(year) + int(month) // 12, int(month) % 12 + 1, 1).date() - timedelta(days=1)
+            holidays = [day.strftime('%Y-%m-%d') for day in holidays_between(first_day, last_day)]
+            # 교사 시간표 기준으로 이번 달에 열리는 시간대
+            available_times = sorted({
+                t for slots, _ in month_slots(teacher.id, first_day, last_day).values() for t in slot_times(slots, (1 << len(slots)) - 1)
+            })
+
             send_success_slack(request, "상담 스케줄 조회", start_time)
             return Response({
                 "success": True,
                 "data": {
                     "availableTimes": available_times,
                     "bookedSlots": booked_slots,
+                    "holidays": holidays,
                     "counselings": counselings_data
                 }
             }, status=status.HTTP_200_OK)
@@ -191,31 +197,158 @@ class AvailableCounselingTimesView(APIView):
                 "error": "날짜 형식은 YYYY-MM-DD이어야 합니다."
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        all_times = [
-            "09:00", "09:30", "10:00", "10:30", "11:00", "11:30",
-            "13:00", "13:30", "14:00", "14:30", "15:00", "15:30",
-            "16:00", "16:30", "17:00"
-        ]
+        day = availability(teacher.id, date, date)[0]
+
+        send_success_slack(request, "예약 가능 시간 조회", start_time)
+        return Response({
+            "success": True,
+            "data": {
+                "availableTimes": day["availableTimes"],
+                "bookedTimes": day["bookedTimes"],
+                "isHoliday": day["isHoliday"]
+            }
+        }, status=status.HTTP_200_OK)
 
-        booked_qs = Counseling.objects.filter(
-            teacher=teacher,
-            counseling_date=date,
-            status='예약확정'
-        ).values_list('counseling_time', flat=True)
 
-        booked_times = sorted(time.strftime('%H:%M') for time in booked_qs)
-        available_times = [t for t in all_times if t not in booked_times]
+class TeacherCounselingAvailabilityView(APIView):
+    permission_classes = [IsAuthenticated]
 
-        send_success_slack(request, "예약 가능 시간 조회", start_time)
+    def get(self, request, teacher_id):
+        start_time = datetime.now()
+        try:
+            start_date = datetime.strptime(request.query_params.get('startDate', ''), "%Y-%m-%d").date()
+            end_date = datetime.strptime(request.query_params.get('endDate', ''), "%Y-%m-%d").date()
+        except ValueError:
+            send_error_slack(request, "상담 가능 시간 기간 조회", start_time)
+            return Response({
+                "success": False,
+                "error": "startDate, endDate는 YYYY-MM-DD 형식이어야 합니다."
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        if start_date > end_date or (end_date - start_date).days >= MAX_RANGE_DAYS:
+            send_error_slack(request, "상담 가능 시간 기간 조회", start_time)
+            return Response({
+                "success": False,
+                "error": f"조회 기간은 {MAX_RANGE_DAYS}일 이내여야 합니다."
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        if not Teacher.objects.filter(id=teacher_id).exists():
+            send_error_slack(request, "상담 가능 시간 기간 조회", start_time)
+            return Response({
+                "success": False,
+                "error": "해당 교사가 존재하지 않습니다."
+            }, status=status.HTTP_404_NOT_FOUND)
+
+        days = availability(teacher_id, start_date, end_date)
+        send_success_slack(request, "상담 가능 시간 기간 조회", start_time)
         return Response({
             "success": True,
             "data": {
-                "availableTimes": available_times,
-                "bookedTimes": booked_times
+                "teacherId": teacher_id,
+                "days": days
             }
         }, status=status.HTTP_200_OK)
 
 
+class TeacherOfficeHourView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, teacher_id):
+        start_time = datetime.now()
+        try:
+            teacher = Teacher.objects.get(id=teacher_id)
+            send_success_slack(request, "상담 시간표 조회", start_time)
+            return Response({
+                "success": True,
+                "data": {
+                    "teacherId": teacher.id,
+                    "officeHours": OfficeHourSerializer(teacher.office_hours.all(), many=True).data,
+                    "blockedPeriods": BlockedPeriodSerializer(teacher.blocked_periods.all(), many=True).data
+                }
+            }, status=status.HTTP_200_OK)
+        except Teacher.DoesNotExist:
+            send_error_slack(request, "상담 시간표 조회", start_time)
+            return Response({"success": False, "error": "해당 교사가 존재하지 않습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+    def put(self, request, teacher_id):
+        # 요일별 시간표 전체 교체, 빈 목록이면 기본 시간표로 돌아감
+        start_time = datetime.now()
+        try:
+            teacher = Teacher.objects.get(id=teacher_id)
+        except Teacher.DoesNotExist:
+            send_error_slack(request, "상담 시간표 수정", start_time)
+            return Response({"success": False, "error": "해당 교사가 존재하지 않습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+        office_hours = request.data.get('officeHours') if isinstance(request.data, dict) else None
+        if not isinstance(office_hours, list):
+            send_error_slack(request, "상담 시간표 수정", start_time)
+            return Response({
+                "success": False,
+                "error": "officeHours 목록이 필요합니다."
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = OfficeHourSerializer(data=office_hours, many=True)
+        if not serializer.is_valid():
+            send_error_slack(request, "상담 시간표 수정", start_time)
+            return Response({"success": False, "error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            with transaction.atomic():
+                teacher.office_hours.all().delete()
+                serializer.save(teacher=teacher)
+                # 커밋 전에 다른 요청이 이전 시간표를 새 버전으로 캐시할 수 있으므로 커밋 후 한 번 더 무효화
+                transaction.on_commit(lambda: invalidate_teacher(teacher.id))
+
+            send_success_slack(request, "상담 시간표 수정", start_time)
+            return Response({
+                "success": True,
+                "data": {
+                    "teacherId": teacher.id,
+                    "officeHours": OfficeHourSerializer(teacher.office_hours.all(), many=True).data
+                }
+            }, status=status.HTTP_200_OK)
+        except Exception as e:
+            send_error_slack(request, "상담 시간표 수정", start_time)
+            return Response({"success": False, "error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class TeacherBlockedPeriodView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, teacher_id):
+        start_time = datetime.now()
+        try:
+            teacher = Teacher.objects.get(id=teacher_id)
+        except Teacher.DoesNotExist:
+            send_error_slack(request, "상담 불가 기간 등록", start_time)
+            return Response({"success": False, "error": "해당 교사가 존재하지 않습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+        serializer = BlockedPeriodSerializer(data=request.data)
+        if not serializer.is_valid():
+            send_error_slack(request, "상담 불가 기간 등록", start_time)
+            return Response({"success": False, "error": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        blocked = serializer.save(teacher=teacher)
+        send_success_slack(request, "상담 불가 기간 등록", start_time)
+        return Response({"success": True, "data": BlockedPeriodSerializer(blocked).data}, status=status.HTTP_201_CREATED)
+
+
+class BlockedPeriodDeleteView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def delete(self, request, blocked_id):
+        start_time = datetime.now()
+        try:
+            blocked = BlockedPeriod.objects.get(id=blocked_id)
+        except BlockedPeriod.DoesNotExist:
+            send_error_slack(request, "상담 불가 기간 삭제", start_time)
+            return Response({"success": False, "error": "해당 기간이 존재하지 않습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+        blocked.delete()
+        send_success_slack(request, "상담 불가 기간 삭제", start_time)
+        return Response({"success": True, "data": {"id": blocked_id}}, status=status.HTTP_200_OK)
+
+
 class CounselingRequestCreateView(APIView):
     permission_classes = [IsAuthenticated]
 
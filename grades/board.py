@@ -0,0 +1,61 @@
+from django.db.models import Count, OuterRef, Subquery
+from classrooms.models import Classroom
+from utils.reference_cache import get_subjects
+from .models import GradeGroup, Grade
+
+STATUSES = ['입력완료', '임시저장', '미입력']
+
+
+def _latest_groups(grade, semester):
+    # GradeManagementStatusView와 같이 학생별 가장 최근 GradeGroup 기준 (요청한 학년 성적만)
+    latest = GradeGroup.objects.filter(student=OuterRef('student'), grade=f"{grade}학년")
+    if semester:
+        latest = latest.filter(semester=semester)
+    groups = GradeGroup.objects.filter(
+        student__classroom__grade=grade,
+        grade=f"{grade}학년",
+        id=Subquery(latest.order_by('-updated_at').values('id')[:1])
+    )
+    if semester:
+        groups = groups.filter(semester=semester)
+    return groups
+
+
+def build_status_board(grade, semester=None):
+    classrooms = list(Classroom.objects.filter(grade=grade).annotate(
+        student_count=Count('student')
+    ).order_by('class_number').values_list('id', 'class_number', 'student_count'))
+
+    groups = _latest_groups(grade, semester)
+    status_counts = groups.values('student__classroom_id', 'grade_status').annotate(
+        count=Count('id')
+    ).values_list('student__classroom_id', 'grade_status', 'count')
+    subject_counts = Grade.objects.filter(grade_group__in=groups.values('id')).values(
+        'grade_group__student__classroom_id', 'subject_id', 'grade_group__grade_status'
+    ).annotate(
+        count=Count('grade_group__student_id', distinct=True)
+    ).values_list('grade_group__student__classroom_id', 'subject_id', 'grade_group__grade_status', 'count')
+
+    subjects = get_subjects()
+    board = {}
+    for classroom_id, class_number, student_count in classrooms:
+        board[classroom_id] = {
+            "classroomId": classroom_id,
+            "classNumber": class_number,
+            "totalStudents": student_count,
+            "status": dict.fromkeys(STATUSES, 0),
+            "subjects": {name: dict.fromkeys(STATUSES, 0) for name in subjects.values()}
+        }
+
+    for classroom_id, grade_status, count in status_counts:
+        board[classroom_id]["status"][grade_status] += count
+    for classroom_id, subject_id, grade_status, count in subject_counts:
+        board[classroom_id]["subjects"][subjects[subject_id]][grade_status] += count
+
+    # 성적이 없는 학생은 미입력으로 집계
+    for item in board.values():
+        item["status"]["미입력"] += item["totalStudents"] - sum(item["status"].values())
+        for counts in item["subjects"].values():
+            counts["미입력"] += item["totalStudents"] - sum(counts.values())
+
+    return list(board.values())
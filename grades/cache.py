@@ -0,0 +1,77 @@
+import threading
+import time
+from django.core.cache import cache
+from django.db import transaction
+
+# 성적 상세 조회 응답 캐시
+# 등수는 같은 학년/학기 다른 학생 점수에도 좌우되므로 학년/학기 단위 버전으로 무효화
+OVERVIEW_TIMEOUT = 60 * 10
+STATISTICS_TIMEOUT = 60 * 60
+
+# 적중률 집계는 조회마다 공유 캐시에 쓰지 않도록 프로세스 단위로만 보관
+_counts_lock = threading.Lock()
+_counts = {"hits": 0, "misses": 0}
+
+
+def _version_key(grade, semester):
+    return f"grades:cohort:{grade}:{semester}:version"
+
+
+def cohort_version(grade, semester):
+    key = _version_key(grade, semester)
+    version = cache.get(key)
+    if version is None:
+        # 버전 키가 사라져도 이전 캐시와 겹치지 않도록 시간 기반으로 시작
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def invalidate_cohort(grade, semester):
+    # 커밋 전에 올리면 다른 요청이 커밋 전 데이터를 새 버전으로 캐시할 수 있으므로 커밋 후에 교체
+    # incr는 DB 캐시에서 원자적이지 않아 동시 쓰기가 같은 버전을 만들 수 있으므로 새 값으로 덮어씀
+    key = _version_key(grade, semester)
+    transaction.on_commit(lambda: cache.set(key, time.time_ns(), None))
+
+
+def _overview_key(student_id, grade, semester):
+    return f"grades:overview:{student_id}:{grade}:{semester}:{cohort_version(grade, semester)}"
+
+
+def _count(key):
+    with _counts_lock:
+        _counts[key] += 1
+
+
+def get_cached_overview(student_id, grade, semester):
+    data = cache.get(_overview_key(student_id, grade, semester))
+    _count("hits" if data is not None else "misses")
+    return data
+
+
+def cache_overview(student_id, grade, semester, data):
+    cache.set(_overview_key(student_id, grade, semester), data, OVERVIEW_TIMEOUT)
+
+
+def _statistics_key(grade, semester, subject_id):
+    return f"grades:statistics:{subject_id}:{grade}:{semester}:{cohort_version(grade, semester)}"
+
+
+def get_cached_statistics(grade, semester, subject_id):
+    return cache.get(_statistics_key(grade, semester, subject_id))
+
+
+def cache_statistics(grade, semester, subject_id, data):
+    cache.set(_statistics_key(grade, semester, subject_id), data, STATISTICS_TIMEOUT)
+
+
+def overview_cache_stats():
+    with _counts_lock:
+        hits = _counts["hits"]
+        misses = _counts["misses"]
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hitRate": round(hits / total, 4) if total else 0.0
+    }
@@ -0,0 +1,29 @@
+import time
+from django.core.management.base import BaseCommand
+from grades.models import GradeGroup
+from grades.ranking import store_cohort
+
+
+class Command(BaseCommand):
+    help = "학년/학기별 과목 등수, 9등급, 환산등급, 석차를 다시 계산해 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grade', help="예: 1학년")
+        parser.add_argument('--semester', help="예: 1학기")
+
+    def handle(self, *args, **options):
+        cohorts = GradeGroup.objects.all()
+        if options['grade']:
+            cohorts = cohorts.filter(grade=options['grade'])
+        if options['semester']:
+            cohorts = cohorts.filter(semester=options['semester'])
+        cohorts = cohorts.values_list('grade', 'semester').distinct().order_by('grade', 'semester')
+
+        for grade, semester in cohorts:
+            started = time.monotonic()
+            result = store_cohort(grade, semester)
+            self.stdout.write(
+                f"{grade} {semester}: 학생 {len(result['students'])}명, "
+                f"성적 {len(result['subjects'])}건 ({time.monotonic() - started:.2f}s)"
+            )
+        self.stdout.write(self.style.SUCCESS("성적 등수 재계산 완료"))
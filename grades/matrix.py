@@ -0,0 +1,161 @@
+from django.db import transaction
+from django.utils import timezone
+from students.models import Student
+from utils.reference_cache import get_subjects, get_subject_ids
+from .models import GradeGroup, Grade
+from .ranking import store_cohort, deferred_rankings, record_score_change
+from .cache import invalidate_cohort
+
+SCORE_FIELDS = {
+    "credits": "credits",
+    "midterm": "midterm",
+    "final": "final",
+    "performance": "performance",
+    "totalScore": "total_score",
+}
+
+def _latest_groups(classroom_id, grade, semester):
+    groups = {}
+    rows = GradeGroup.objects.filter(
+        student__classroom_id=classroom_id, grade=grade, semester=semester
+    ).order_by('student_id', '-updated_at', '-id').values_list('id', 'student_id', 'grade_status')
+    for group_id, student_id, grade_status in rows:
+        groups.setdefault(student_id, (group_id, grade_status))
+    return groups
+
+
+def load_matrix(classroom_id, grade, semester):
+    students = list(
+        Student.objects.filter(classroom_id=classroom_id).select_related('user').order_by('student_number', 'id')
+    )
+    groups = _latest_groups(classroom_id, grade, semester)
+    column = {groups[s.id][0]: index for index, s in enumerate(students) if s.id in groups}
+
+    subjects = get_subjects()
+    columns = {
+        name: {key: [None] * len(students) for key in (*SCORE_FIELDS, "rank", "gradeLevel")}
+        for name in subjects.values()
+    }
+    rows = Grade.objects.filter(grade_group_id__in=column).values_list(
+        'grade_group_id', 'subject_id', 'credits', 'midterm', 'final', 'performance',
+        'total_score', 'rank', 'grade_level'
+    )
+    for group_id, subject_id, *values in rows:
+        cells = columns[subjects[subject_id]]
+        for key, value in zip((*SCORE_FIELDS, "rank", "gradeLevel"), values):
+            cells[key][column[group_id]] = value
+
+    return {
+        "grade": grade,
+        "semester": semester,
+        "students": {
+            "id": [s.id for s in students],
+            "studentId": [s.student_id for s in students],
+            "name": [s.user.name for s in students],
+            "number": [s.student_number for s in students],
+            "gradeStatus": [groups[s.id][1] if s.id in groups else '미입력' for s in students]
+        },
+        "subjects": columns
+    }
+
+
+def apply_matrix_cells(classroom_id, grade, semester, cells):
+    # cells: [(행 번호, 검증된 셀)], 오류가 하나라도 있으면 아무것도 저장하지 않음
+    students = dict(
+        Student.objects.filter(
+            classroom_id=classroom_id, student_id__in={cell['studentId'] for _, cell in cells}
+        ).values_list('student_id', 'id')
+    )
+    subjects = get_subject_ids({cell['subject'] for _, cell in cells})
+    groups = _latest_groups(classroom_id, grade, semester)
+    existing = {
+        (g.grade_group_id, g.subject_id): g
+        for g in Grade.objects.filter(grade_group_id__in=[group_id for group_id, _ in groups.values()])
+    }
+
+    errors = []
+    seen = set()
+    targets = []
+    for index, cell in cells:
+        cell_errors = {}
+        student_id = students.get(cell['studentId'])
+        subject_id = subjects.get(cell['subject'])
+        if student_id is None:
+            cell_errors['studentId'] = ["해당 반의 학생이 아닙니다."]
+        if subject_id is None:
+            cell_errors['subject'] = ["해당 과목이 존재하지 않습니다."]
+        elif student_id is not None and (student_id, subject_id) in seen:
+            cell_errors['subject'] = ["같은 학생의 과목이 중복되었습니다."]
+        seen.add((student_id, subject_id))
+
+        row = None
+        if student_id in groups:
+            row = existing.get((groups[student_id][0], subject_id))
+        if row is None and not cell_errors:
+            missing = [key for key in SCORE_FIELDS if key not in cell]
+            if missing:
+                cell_errors['cell'] = ["새로 입력하는 성적은 모든 점수가 필요합니다: " + ", ".join(missing)]
+        if cell_errors:
+            errors.append({"row": index, "errors": cell_errors})
+        else:
+            targets.append((student_id, subject_id, row, cell))
+
+    if errors:
+        return errors, None
+
+    with transaction.atomic():
+        new_groups = {}
+        for student_id, _, row, _ in targets:
+            if row is None and student_id not in groups and student_id not in new_groups:
+                new_groups[student_id] = GradeGroup(
+                    student_id=student_id,
+                    grade=grade,
+                    semester=semester,
+                    grade_status='임시저장',
+                    updated_at=timezone.now()
+                )
+        GradeGroup.objects.bulk_create(new_groups.values())
+
+        updated = []
+        created = []
+        changes = []
+        for student_id, subject_id, row, cell in targets:
+            if row is None:
+                group_id = groups[student_id][0] if student_id in groups else new_groups[student_id].id
+                created.append((student_id, Grade(
+                    grade_group_id=group_id,
+                    subject_id=subject_id,
+                    **{field: cell[key] for key, field in SCORE_FIELDS.items()}
+                )))
+                continue
+            previous = (row.credits, row.total_score)
+            for key, field in SCORE_FIELDS.items():
+                if key in cell:
+                    setattr(row, field, cell[key])
+            updated.append(row)
+            if previous != (row.credits, row.total_score):
+                changes.append((student_id, subject_id, row.id, previous[1], row.total_score))
+
+        Grade.objects.bulk_update(updated, list(SCORE_FIELDS.values()), batch_size=500)
+        Grade.objects.bulk_create([row for _, row in created], batch_size=500)
+        changes += [(student_id, row.subject_id, row.id, None, row.total_score) for student_id, row in created]
+
+        # bulk_* 는 시그널을 보내지 않으므로 석차 갱신을 직접 처리
+        # 증분 갱신은 과목별로 한 건씩 바뀌는 경우만 맞으므로 여러 학생이 바뀌면 학년 전체 재계산
+        if len({change[0] for change in changes}) > 1:
+            store_cohort(grade, semester)
+        else:
+            with deferred_rankings():
+                for student_id, subject_id, grade_id, old, new in changes:
+                    record_score_change(student_id, grade, semester, subject_id, grade_id, old, new)
+
+        # 중간/기말/수행 점수만 바뀌어 등수가 그대로여도 성적 상세 캐시에는 반영되어야 함
+        if updated or created:
+            invalidate_cohort(grade, semester)
+
+    return [], {
+        "updated": len(updated),
+        "created": len(created),
+        "newGroups": len(new_groups)
+    }
+
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.7 on 2026-10-18 20:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('grades', '0001_initial'),
+        ('subjects', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScoreDistribution',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('grade', models.CharField(max_length=10)),
+                ('semester', models.CharField(max_length=10)),
+                ('scores', models.JSONField(default=list)),
+                ('subject', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='subjects.subject')),
+            ],
+            options={
+                'unique_together': {('grade', 'semester', 'subject')},
+            },
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.1.7 on 2026-10-18 20:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def build_cohort_rankings(apps, schema_editor):
+    GradeGroup = apps.get_model('grades', 'GradeGroup')
+    CohortRanking = apps.get_model('grades', 'CohortRanking')
+
+    latest = {}
+    for group in GradeGroup.objects.order_by('updated_at'):
+        latest[(group.student_id, group.grade, group.semester)] = group
+
+    rankings = []
+    for (student_id, grade, semester), group in latest.items():
+        rows = list(group.grades.values_list('total_score', 'credits'))
+        credits = sum(c for _, c in rows)
+        if credits <= 0:
+            continue
+        rankings.append(CohortRanking(
+            student_id=student_id,
+            grade=grade,
+            semester=semester,
+            average=sum(s * c for s, c in rows) / credits,
+            total_credits=credits
+        ))
+    CohortRanking.objects.bulk_create(rankings, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('grades', '0002_scoredistribution'),
+        ('students', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CohortRanking',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('grade', models.CharField(max_length=10)),
+                ('semester', models.CharField(max_length=10)),
+                ('average', models.FloatField()),
+                ('total_credits', models.PositiveIntegerField()),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='students.student')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['grade', 'semester', 'average'], name='grades_coho_grade_f52e94_idx')],
+                'unique_together': {('student', 'grade', 'semester')},
+            },
+        ),
+        migrations.RunPython(build_cohort_rankings, migrations.RunPython.noop),
+    ]
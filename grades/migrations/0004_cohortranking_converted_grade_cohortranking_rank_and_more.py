@@ -0,0 +1,33 @@
+# Generated by Django 5.1.7 on 2026-10-18 20:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('grades', '0003_cohortranking'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cohortranking',
+            name='converted_grade',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='cohortranking',
+            name='rank',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='grade',
+            name='grade_level',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='grade',
+            name='rank',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
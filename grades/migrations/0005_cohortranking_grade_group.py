@@ -0,0 +1,36 @@
+# Generated by Django 5.1.7 on 2026-10-18 20:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def link_latest_groups(apps, schema_editor):
+    GradeGroup = apps.get_model('grades', 'GradeGroup')
+    CohortRanking = apps.get_model('grades', 'CohortRanking')
+
+    latest = {}
+    for group_id, student_id, grade, semester in GradeGroup.objects.order_by('updated_at', 'id').values_list(
+        'id', 'student_id', 'grade', 'semester'
+    ):
+        latest[(student_id, grade, semester)] = group_id
+
+    rankings = list(CohortRanking.objects.all())
+    for ranking in rankings:
+        ranking.grade_group_id = latest.get((ranking.student_id, ranking.grade, ranking.semester))
+    CohortRanking.objects.bulk_update(rankings, ['grade_group'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('grades', '0004_cohortranking_converted_grade_cohortranking_rank_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cohortranking',
+            name='grade_group',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='grades.gradegroup'),
+        ),
+        migrations.RunPython(link_latest_groups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,110 @@
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from django.db import migrations
+
+# grades.ranking.GRADE_LEVEL_CUTOFFS 와 같은 값 (마이그레이션은 현재 앱 코드를 쓰지 않음)
+GRADE_LEVEL_CUTOFFS = [0.04, 0.11, 0.23, 0.40, 0.60, 0.77, 0.89, 0.96]
+
+
+def backfill_rankings(apps, schema_editor):
+    # 0004에서 추가한 Grade.rank/grade_level, CohortRanking.rank/converted_grade 채우기
+    # 계산은 grades.ranking.compute_cohort 와 같고, 캐시는 건드리지 않음
+    GradeGroup = apps.get_model('grades', 'GradeGroup')
+    Grade = apps.get_model('grades', 'Grade')
+    ScoreDistribution = apps.get_model('grades', 'ScoreDistribution')
+    CohortRanking = apps.get_model('grades', 'CohortRanking')
+
+    cohorts = GradeGroup.objects.values_list('grade', 'semester').distinct().order_by('grade', 'semester')
+    for grade, semester in list(cohorts):
+        rows = list(Grade.objects.filter(
+            grade_group__grade=grade,
+            grade_group__semester=semester
+        ).order_by('id').values_list('id', 'grade_group_id', 'subject_id', 'credits', 'total_score'))
+
+        distributions = defaultdict(list)
+        for _, _, subject_id, _, score in rows:
+            distributions[subject_id].append(score)
+        for scores in distributions.values():
+            scores.sort()
+
+        levels = {}
+        grades_by_group = defaultdict(list)
+        changed = []
+        stored = dict((row[0], row[1:]) for row in Grade.objects.filter(
+            id__in=[row[0] for row in rows]
+        ).values_list('id', 'rank', 'grade_level'))
+        for grade_id, group_id, subject_id, credits, score in rows:
+            scores = distributions[subject_id]
+            rank = len(scores) - bisect_right(scores, score) + 1
+            level = bisect_left(GRADE_LEVEL_CUTOFFS, rank / len(scores)) + 1
+            levels[grade_id] = level
+            grades_by_group[group_id].append((grade_id, credits, score))
+            if stored[grade_id] != (rank, level):
+                changed.append(Grade(id=grade_id, rank=rank, grade_level=level))
+        Grade.objects.bulk_update(changed, ['rank', 'grade_level'], batch_size=500)
+
+        for subject_id, scores in distributions.items():
+            ScoreDistribution.objects.update_or_create(
+                grade=grade, semester=semester, subject_id=subject_id, defaults={"scores": scores}
+            )
+        ScoreDistribution.objects.filter(grade=grade, semester=semester).exclude(
+            subject_id__in=distributions
+        ).delete()
+
+        latest = {}
+        for group_id, student_id, school_grade in GradeGroup.objects.filter(
+            grade=grade,
+            semester=semester
+        ).order_by('updated_at', 'id').values_list('id', 'student_id', 'student__classroom__grade'):
+            latest[student_id] = (group_id, school_grade)
+
+        students = {}
+        for student_id, (group_id, school_grade) in latest.items():
+            items = grades_by_group[group_id]
+            credits = sum(c for _, c, _ in items)
+            if credits <= 0:
+                continue
+            students[student_id] = {
+                "grade_group_id": group_id,
+                "school_grade": school_grade,
+                "average": sum(score * c for _, c, score in items) / credits,
+                "total_credits": credits,
+                "converted_grade": round(sum(levels[grade_id] * c for grade_id, c, _ in items) / credits, 2)
+            }
+
+        # 석차는 현재 학급 학년이 같은 학생끼리 비교
+        partitions = defaultdict(list)
+        for item in students.values():
+            partitions[item["school_grade"]].append(item["average"])
+        for averages in partitions.values():
+            averages.sort()
+
+        CohortRanking.objects.filter(grade=grade, semester=semester).delete()
+        CohortRanking.objects.bulk_create([
+            CohortRanking(
+                student_id=student_id,
+                grade_group_id=item["grade_group_id"],
+                grade=grade,
+                semester=semester,
+                average=item["average"],
+                total_credits=item["total_credits"],
+                rank=len(partitions[item["school_grade"]]) - bisect_right(
+                    partitions[item["school_grade"]], item["average"] + 1e-6
+                ) + 1,
+                converted_grade=item["converted_grade"]
+            )
+            for student_id, item in students.items()
+        ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('grades', '0005_cohortranking_grade_group'),
+        ('classrooms', '0001_initial'),
+        ('students', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_rankings, migrations.RunPython.noop),
+    ]
@@ -21,3 +21,30 @@ class Grade(models.Model):
     final = models.FloatField()
     performance = models.FloatField()
     total_score = models.FloatField()
+    rank = models.PositiveIntegerField(null=True, blank=True)
+    grade_level = models.PositiveSmallIntegerField(null=True, blank=True)
+
+
+class ScoreDistribution(models.Model):
+    grade = models.CharField(max_length=10)
+    semester = models.CharField(max_length=10)
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE)
+    scores = models.JSONField(default=list)
+
+    class Meta:
+        unique_together = ('grade', 'semester', 'subject')
+
+
+class CohortRanking(models.Model):
+    student = models.ForeignKey(Student, on_delete=models.CASCADE)
+    grade_group = models.ForeignKey(GradeGroup, on_delete=models.SET_NULL, null=True, blank=True)
+    grade = models.CharField(max_length=10)
+    semester = models.CharField(max_length=10)
+    average = models.FloatField()
+    total_credits = models.PositiveIntegerField()
+    rank = models.PositiveIntegerField(null=True, blank=True)
+    converted_grade = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ('student', 'grade', 'semester')
+        indexes = [models.Index(fields=['grade', 'semester', 'average'])]
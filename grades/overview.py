@@ -0,0 +1,61 @@
+from .ranking import grade_level_for
+
+
+def build_overview(student, grades, subject_ranks, final_rank):
+    # grades: subject가 로드된 Grade 목록
+    # subject_ranks: {grade.id: (등수, 인원)}, final_rank: (석차, 인원)
+    subject_results = []
+    total_credits = 0
+    weighted_total_score = 0
+    weighted_grade_sum = 0
+
+    for grade in grades:
+        rank, total = subject_ranks[grade.id]
+        grade_level = grade_level_for(rank / total)
+
+        subject_results.append({
+            "name": grade.subject.name,
+            "credits": grade.credits,
+            "midterm": grade.midterm,
+            "final": grade.final,
+            "performance": grade.performance,
+            "totalScore": grade.total_score,
+            "rank": f"{rank}/{total}",
+            "gradeLevel": grade_level
+        })
+
+        total_credits += grade.credits
+        weighted_total_score += grade.total_score * grade.credits
+        weighted_grade_sum += grade_level * grade.credits
+
+    sum_midterm = sum([g.midterm for g in grades]) / len(grades)
+    sum_final = sum([g.final for g in grades]) / len(grades)
+    sum_performance = sum([g.performance for g in grades]) / len(grades)
+    sum_total_score = weighted_total_score / total_credits
+    converted_grade = round(weighted_grade_sum / total_credits, 2)
+    my_rank, total_students = final_rank
+
+    return {
+        "studentId": student.student_id,
+        "studentName": student.user.name,
+        "grade": student.classroom.grade if student.classroom else None,
+        "classNumber": student.classroom.class_number if student.classroom else None,
+        "number": student.student_number,
+        "subjects": subject_results,
+        "totals": {
+            "totalCredits": total_credits,
+            "sumMidterm": round(sum_midterm, 1),
+            "sumFinal": round(sum_final, 1),
+            "sumPerformance": round(sum_performance, 1),
+            "sumTotalScore": round(sum_total_score, 1)
+        },
+        "finalSummary": {
+            "totalStudents": total_students,
+            "finalRank": f"{my_rank}/{total_students}",
+            "finalConvertedGrade": converted_grade
+        },
+        "radarChart": {
+            "labels": [s["name"] for s in subject_results],
+            "data": [s["totalScore"] for s in subject_results]
+        }
+    }
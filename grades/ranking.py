@@ -0,0 +1,475 @@
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from django.db import transaction
+from django.db.models import Case, Count, F, Q, Value, When
+from .models import GradeGroup, Grade, ScoreDistribution, CohortRanking
+from .cache import invalidate_cohort
+
+# 9등급 누적 비율 (4%, 11%, 23%, 40%, 60%, 77%, 89%, 96%, 100%)
+GRADE_LEVEL_CUTOFFS = [0.04, 0.11, 0.23, 0.40, 0.60, 0.77, 0.89, 0.96]
+
+
+def grade_level_for(percentile):
+    return bisect_left(GRADE_LEVEL_CUTOFFS, percentile) + 1
+
+
+def rank_in_distribution(scores, score):
+    # scores는 오름차순 정렬, 동점자는 같은 등수 (sum(s > score) + 1)
+    return len(scores) - bisect_right(scores, score) + 1
+
+
+def refresh_distribution(grade, semester, subject_id):
+    scores = sorted(Grade.objects.filter(
+        grade_group__grade=grade,
+        grade_group__semester=semester,
+        subject_id=subject_id
+    ).values_list('total_score', flat=True))
+
+    ScoreDistribution.objects.update_or_create(
+        grade=grade,
+        semester=semester,
+        subject_id=subject_id,
+        defaults={"scores": scores}
+    )
+    return scores
+
+
+def get_distributions(grade, semester, subject_ids):
+    distributions = dict(ScoreDistribution.objects.filter(
+        grade=grade,
+        semester=semester,
+        subject_id__in=subject_ids
+    ).values_list('subject_id', 'scores'))
+
+    for subject_id in subject_ids:
+        if subject_id not in distributions:
+            distributions[subject_id] = refresh_distribution(grade, semester, subject_id)
+    return distributions
+
+
+def weighted_average(rows):
+    # rows: (total_score, credits)
+    rows = list(rows)
+    total = sum(score * credits for score, credits in rows)
+    credits = sum(credits for _, credits in rows)
+    if credits <= 0:
+        return None, 0
+    return total / credits, credits
+
+
+def refresh_cohort_ranking(student_id, grade, semester):
+    group = GradeGroup.objects.filter(
+        student_id=student_id,
+        grade=grade,
+        semester=semester
+    ).order_by('-updated_at', '-id').first()
+
+    average, credits = (None, 0)
+    if group:
+        average, credits = weighted_average(group.grades.values_list('total_score', 'credits'))
+
+    if average is None:
+        CohortRanking.objects.filter(student_id=student_id, grade=grade, semester=semester).delete()
+        return None
+
+    ranking, _ = CohortRanking.objects.update_or_create(
+        student_id=student_id,
+        grade=grade,
+        semester=semester,
+        defaults={"grade_group": group, "average": average, "total_credits": credits}
+    )
+    return ranking
+
+
+def get_cohort_rank(student, grade, semester, average):
+    # 같은 학년(현재 학급 기준) 학생들 중 해당 학년/학기 가중평균 등수
+    result = CohortRanking.objects.filter(
+        grade=grade,
+        semester=semester,
+        student__classroom__grade=student.classroom.grade
+    ).aggregate(
+        total=Count('id'),
+        higher=Count('id', filter=Q(average__gt=average + 1e-6)),
+        mine=Count('id', filter=Q(student=student))
+    )
+    if not result['mine']:
+        return None, result['total']
+    return result['higher'] + 1, result['total']
+
+
+def compute_cohort(grade, semester):
+    # 학년/학기 전체를 한번에 읽어 과목별 등수·등급과 학생별 환산등급·석차를 계산
+    rows = list(Grade.objects.filter(
+        grade_group__grade=grade,
+        grade_group__semester=semester
+    ).order_by('id').values_list('id', 'grade_group_id', 'subject_id', 'credits', 'total_score'))
+
+    distributions = defaultdict(list)
+    for _, _, subject_id, _, score in rows:
+        distributions[subject_id].append(score)
+    for scores in distributions.values():
+        scores.sort()
+
+    subjects = {}
+    grades_by_group = defaultdict(list)
+    for grade_id, group_id, subject_id, credits, score in rows:
+        scores = distributions[subject_id]
+        rank = rank_in_distribution(scores, score)
+        percentile = rank / len(scores)
+        subjects[grade_id] = {
+            "rank": rank,
+            "total": len(scores),
+            "percentile": percentile,
+            "grade_level": grade_level_for(percentile)
+        }
+        grades_by_group[group_id].append((grade_id, credits, score))
+
+    latest = {}
+    for group_id, student_id, school_grade in GradeGroup.objects.filter(
+        grade=grade,
+        semester=semester
+    ).order_by('updated_at', 'id').values_list('id', 'student_id', 'student__classroom__grade'):
+        latest[student_id] = (group_id, school_grade)
+
+    students = {}
+    for student_id, (group_id, school_grade) in latest.items():
+        items = grades_by_group[group_id]
+        average, credits = weighted_average((score, credits) for _, credits, score in items)
+        if average is None:
+            continue
+        level_sum = sum(subjects[grade_id]["grade_level"] * credits for grade_id, credits, _ in items)
+        students[student_id] = {
+            "grade_group_id": group_id,
+            "school_grade": school_grade,
+            "average": average,
+            "total_credits": credits,
+            "converted_grade": round(level_sum / credits, 2)
+        }
+
+    # 석차는 현재 학급 학년이 같은 학생끼리 비교 (GradeOverviewView와 동일)
+    partitions = defaultdict(list)
+    for result in students.values():
+        partitions[result["school_grade"]].append(result["average"])
+    for averages in partitions.values():
+        averages.sort()
+    for result in students.values():
+        averages = partitions[result["school_grade"]]
+        result["rank"] = len(averages) - bisect_right(averages, result["average"] + 1e-6) + 1
+        result["total"] = len(averages)
+
+    return {
+        "distributions": dict(distributions),
+        "subjects": subjects,
+        "students": students
+    }
+
+
+def store_cohort(grade, semester, result=None):
+    if result is None:
+        result = compute_cohort(grade, semester)
+
+    with transaction.atomic():
+        for subject_id, scores in result["distributions"].items():
+            ScoreDistribution.objects.update_or_create(
+                grade=grade,
+                semester=semester,
+                subject_id=subject_id,
+                defaults={"scores": scores}
+            )
+        ScoreDistribution.objects.filter(grade=grade, semester=semester).exclude(
+            subject_id__in=result["distributions"]
+        ).delete()
+
+        changed = []
+        for grade_row in Grade.objects.filter(id__in=result["subjects"]).only('id', 'rank', 'grade_level'):
+            computed = result["subjects"][grade_row.id]
+            if grade_row.rank != computed["rank"] or grade_row.grade_level != computed["grade_level"]:
+                grade_row.rank = computed["rank"]
+                grade_row.grade_level = computed["grade_level"]
+                changed.append(grade_row)
+        Grade.objects.bulk_update(changed, ['rank', 'grade_level'], batch_size=500)
+
+        CohortRanking.objects.filter(grade=grade, semester=semester).delete()
+        CohortRanking.objects.bulk_create([
+            CohortRanking(
+                student_id=student_id,
+                grade_group_id=item["grade_group_id"],
+                grade=grade,
+                semester=semester,
+                average=item["average"],
+                total_credits=item["total_credits"],
+                rank=item["rank"],
+                converted_grade=item["converted_grade"]
+            )
+            for student_id, item in result["students"].items()
+        ], batch_size=500)
+
+    invalidate_cohort(grade, semester)
+    return result
+
+
+# 성적 한 건이 바뀔 때마다 학년 전체를 다시 계산하지 않고,
+# 점수가 이동한 구간의 등수만 +1/-1 하는 방식으로 저장된 등수를 유지
+_pending = threading.local()
+
+
+def level_thresholds(total):
+    # 등급별로 rank / total <= 비율을 만족하는 최대 등수
+    thresholds = []
+    for cutoff in GRADE_LEVEL_CUTOFFS:
+        rank = int(cutoff * total)
+        while (rank + 1) / total <= cutoff:
+            rank += 1
+        while rank > 0 and rank / total > cutoff:
+            rank -= 1
+        thresholds.append(rank)
+    return thresholds
+
+
+def grade_level_expression(total):
+    return Case(
+        *[When(rank__lte=threshold, then=Value(level))
+          for level, threshold in enumerate(level_thresholds(total), start=1)],
+        default=Value(len(GRADE_LEVEL_CUTOFFS) + 1)
+    )
+
+
+def _score_range(old, new):
+    # 다른 학생 점수 s의 등수는 (이 학생 점수 > s) 여부가 바뀔 때만 변한다
+    if old == new:
+        return None, 0
+    if old is None:
+        return Q(total_score__lt=new), 1
+    if new is None:
+        return Q(total_score__lt=old), -1
+    if new > old:
+        return Q(total_score__gte=old, total_score__lt=new), 1
+    return Q(total_score__gte=new, total_score__lt=old), -1
+
+
+def _average_range(old, new):
+    # 석차 비교는 1e-6 오차를 허용 (average > mine + 1e-6)
+    if old == new:
+        return None, 0
+    if old is None:
+        return Q(average__lt=new - 1e-6), 1
+    if new is None:
+        return Q(average__lt=old - 1e-6), -1
+    if new > old:
+        return Q(average__gte=old - 1e-6, average__lt=new - 1e-6), 1
+    return Q(average__gte=new - 1e-6, average__lt=old - 1e-6), -1
+
+
+def rerank_subject(grade, semester, subject_id):
+    rows = list(Grade.objects.filter(
+        grade_group__grade=grade,
+        grade_group__semester=semester,
+        subject_id=subject_id
+    ).only('id', 'total_score', 'rank', 'grade_level'))
+    scores = sorted(row.total_score for row in rows)
+
+    changed = []
+    for row in rows:
+        rank = rank_in_distribution(scores, row.total_score)
+        level = grade_level_for(rank / len(scores))
+        if row.rank != rank or row.grade_level != level:
+            row.rank = rank
+            row.grade_level = level
+            changed.append(row)
+    Grade.objects.bulk_update(changed, ['rank', 'grade_level'], batch_size=500)
+
+    ScoreDistribution.objects.update_or_create(
+        grade=grade,
+        semester=semester,
+        subject_id=subject_id,
+        defaults={"scores": scores}
+    )
+
+
+def apply_score_change(grade, semester, subject_id, grade_id, old, new):
+    # 반환값: 등급이 바뀌었을 수 있는 GradeGroup id 목록 (None이면 학년 전체)
+    if old == new:
+        return []
+
+    rows = Grade.objects.filter(
+        grade_group__grade=grade,
+        grade_group__semester=semester,
+        subject_id=subject_id
+    )
+    with transaction.atomic():
+        distribution = ScoreDistribution.objects.select_for_update().filter(
+            grade=grade, semester=semester, subject_id=subject_id
+        ).first()
+        if distribution is None or rows.filter(rank__isnull=True).exclude(id=grade_id).exists():
+            rerank_subject(grade, semester, subject_id)
+            return None
+
+        scores = distribution.scores
+        size = len(scores)
+        if old is not None:
+            index = bisect_left(scores, old)
+            if index == len(scores) or scores[index] != old:
+                rerank_subject(grade, semester, subject_id)
+                return None
+            scores.pop(index)
+        if new is not None:
+            insort(scores, new)
+        distribution.save(update_fields=['scores'])
+
+        shifted, delta = _score_range(old, new)
+        if shifted is not None:
+            rows.filter(shifted).exclude(id=grade_id).update(rank=F('rank') + delta)
+        if new is not None:
+            rows.filter(id=grade_id).update(rank=rank_in_distribution(scores, new))
+        if not scores:
+            return []
+
+        # 인원이 바뀌면 모든 학생의 백분위가 바뀌므로 등급 전체 갱신
+        if len(scores) != size:
+            rows.update(grade_level=grade_level_expression(len(scores)))
+            return None
+
+        targets = Q(id=grade_id)
+        if shifted is not None:
+            targets |= shifted
+        rows.filter(targets).update(grade_level=grade_level_expression(len(scores)))
+        return list(rows.filter(targets).values_list('grade_group_id', flat=True))
+
+
+def apply_student_change(student_id, grade, semester):
+    # 반환값: 환산등급을 다시 계산할 GradeGroup id (None이면 학년 전체)
+    from students.models import Student
+
+    with transaction.atomic():
+        # 다른 학생 석차를 밀기 전에 학년/학기 단위로 잠가 동시 수정이 서로의 이전 평균으로 밀지 않게 함
+        CohortRanking.objects.select_for_update().filter(
+            grade=grade, semester=semester
+        ).order_by('id').values_list('id', flat=True).first()
+
+        previous = CohortRanking.objects.filter(
+            student_id=student_id, grade=grade, semester=semester
+        ).values_list('average', flat=True).first()
+        ranking = refresh_cohort_ranking(student_id, grade, semester)
+        current = ranking.average if ranking else None
+
+        school_grade = Student.objects.filter(id=student_id).values_list('classroom__grade', flat=True).first()
+        rankings = CohortRanking.objects.filter(
+            grade=grade,
+            semester=semester,
+            student__classroom__grade=school_grade
+        )
+        if rankings.filter(rank__isnull=True).exclude(student_id=student_id).exists():
+            store_cohort(grade, semester)
+            return None
+
+        shifted, delta = _average_range(previous, current)
+        if shifted is not None:
+            rankings.filter(shifted).exclude(student_id=student_id).update(rank=F('rank') + delta)
+        if ranking is None:
+            return []
+
+        ranking.rank = rankings.filter(average__gt=current + 1e-6).count() + 1
+        ranking.save(update_fields=['rank'])
+        return [ranking.grade_group_id]
+
+
+def refresh_converted_grades(grade, semester, group_ids=None):
+    rankings = CohortRanking.objects.filter(grade=grade, semester=semester)
+    if group_ids is not None:
+        rankings = rankings.filter(grade_group_id__in=group_ids)
+    rankings = list(rankings.only('id', 'grade_group_id', 'converted_grade'))
+
+    levels = defaultdict(list)
+    for group_id, credits, level in Grade.objects.filter(
+        grade_group_id__in=[r.grade_group_id for r in rankings]
+    ).values_list('grade_group_id', 'credits', 'grade_level'):
+        levels[group_id].append((credits, level))
+
+    changed = []
+    for ranking in rankings:
+        items = levels[ranking.grade_group_id]
+        credits = sum(c for c, _ in items)
+        converted = None
+        if credits and all(level is not None for _, level in items):
+            converted = round(sum(c * level for c, level in items) / credits, 2)
+        if ranking.converted_grade != converted:
+            ranking.converted_grade = converted
+            changed.append(ranking)
+    CohortRanking.objects.bulk_update(changed, ['converted_grade'], batch_size=500)
+
+
+def rerank_locked(grade, semester, subject_id):
+    with transaction.atomic():
+        ScoreDistribution.objects.select_for_update().filter(
+            grade=grade, semester=semester, subject_id=subject_id
+        ).first()
+        rerank_subject(grade, semester, subject_id)
+
+
+def flush_changes(changes):
+    affected = {}
+    # 같은 과목이 여러 번 바뀌면 +1/-1 이동이 DB 최종 상태와 어긋나므로 그 과목은 한 번만 다시 계산
+    counts = Counter(change[:3] for change in changes["scores"])
+    reranked = set()
+    # 과목·학년/학기 잠금은 항상 같은 순서로 잡아 동시 요청 간 교착을 피함
+    for grade, semester, subject_id, grade_id, old, new in sorted(changes["scores"], key=lambda change: change[:3]):
+        key = (grade, semester, subject_id)
+        if counts[key] > 1:
+            if key not in reranked:
+                rerank_locked(grade, semester, subject_id)
+                reranked.add(key)
+            groups = None
+        else:
+            groups = apply_score_change(grade, semester, subject_id, grade_id, old, new)
+        _merge_affected(affected, (grade, semester), groups)
+    for student_id, grade, semester in sorted(changes["students"], key=lambda item: (item[1], item[2], item[0])):
+        groups = apply_student_change(student_id, grade, semester)
+        _merge_affected(affected, (grade, semester), groups)
+    for (grade, semester), groups in affected.items():
+        refresh_converted_grades(grade, semester, groups)
+        invalidate_cohort(grade, semester)
+
+
+def _merge_affected(affected, key, groups):
+    if groups is None or affected.get(key, ()) is None:
+        affected[key] = None
+    else:
+        affected.setdefault(key, set()).update(groups)
+
+
+def record_score_change(student_id, grade, semester, subject_id, grade_id, old, new):
+    changes = getattr(_pending, "changes", None)
+    if changes is None:
+        flush_changes({
+            "scores": [(grade, semester, subject_id, grade_id, old, new)],
+            "students": [(student_id, grade, semester)]
+        })
+        return
+    changes["scores"].append((grade, semester, subject_id, grade_id, old, new))
+    if (student_id, grade, semester) not in changes["students"]:
+        changes["students"].append((student_id, grade, semester))
+
+
+def record_student_change(student_id, grade, semester):
+    changes = getattr(_pending, "changes", None)
+    if changes is None:
+        flush_changes({"scores": [], "students": [(student_id, grade, semester)]})
+    elif (student_id, grade, semester) not in changes["students"]:
+        changes["students"].append((student_id, grade, semester))
+
+
+@contextmanager
+def deferred_rankings():
+    # 요청 하나에서 여러 성적을 저장할 때 학생 석차·환산등급은 마지막에 한번만 갱신
+    if getattr(_pending, "changes", None) is not None:
+        yield
+        return
+    # 예외가 나면 호출한 쪽 트랜잭션과 함께 버리고, 정상 종료일 때만 반영
+    changes = _pending.changes = {"scores": [], "students": []}
+    try:
+        yield
+    finally:
+        _pending.changes = None
+    flush_changes(changes)
@@ -10,7 +10,7 @@ class GradeStudentStatusSerializer(serializers.Serializer):
     classNumber = serializers.SerializerMethodField()
     number = serializers.IntegerField(source='student_number')
     profileImage = serializers.URLField(source='profile_image')
-    gradeStatus = serializers.CharField()
+    gradeStatus = serializers.CharField(source='grade_status')
 
     def get_grade(self, obj):
         return obj.classroom.grade if obj.classroom else None
@@ -23,4 +23,46 @@ class GradeInputSerializer(serializers.Serializer):
     semester = serializers.CharField()
     gradeStatus = serializers.ChoiceField(choices=['입력완료', '임시저장', '미입력'])
     updatedAt = serializers.DateTimeField()
-    subjects = serializers.ListField(child=serializers.DictField())
\ No newline at end of file
+    subjects = serializers.ListField(child=serializers.DictField())
+
+class GradeBulkUploadSerializer(serializers.Serializer):
+    grade = serializers.CharField()
+    semester = serializers.CharField()
+    gradeStatus = serializers.ChoiceField(choices=['입력완료', '임시저장', '미입력'])
+    updatedAt = serializers.DateTimeField()
+
+class GradeBulkRowSerializer(serializers.Serializer):
+    studentId = serializers.CharField()
+    subject = serializers.CharField()
+    credits = serializers.IntegerField(min_value=0)
+    midterm = serializers.FloatField()
+    final = serializers.FloatField()
+    performance = serializers.FloatField()
+    totalScore = serializers.FloatField()
+
+class GradeMatrixSerializer(serializers.Serializer):
+    grade = serializers.IntegerField()
+    classNumber = serializers.IntegerField()
+    semester = serializers.CharField()
+    cells = serializers.ListField(child=serializers.DictField())
+
+class GradeMatrixCellSerializer(serializers.Serializer):
+    studentId = serializers.CharField()
+    subject = serializers.CharField()
+    credits = serializers.IntegerField(min_value=0, required=False)
+    midterm = serializers.FloatField(required=False)
+    final = serializers.FloatField(required=False)
+    performance = serializers.FloatField(required=False)
+    totalScore = serializers.FloatField(required=False)
+
+class GradeSimulationSerializer(serializers.Serializer):
+    grade = serializers.CharField(required=False)
+    semester = serializers.CharField(required=False)
+    subjects = serializers.ListField(child=serializers.DictField(), allow_empty=False)
+
+class GradeSimulationSubjectSerializer(serializers.Serializer):
+    subject = serializers.CharField()
+    midterm = serializers.FloatField(required=False)
+    final = serializers.FloatField(required=False)
+    performance = serializers.FloatField(required=False)
+    totalScore = serializers.FloatField(required=False)
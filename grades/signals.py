@@ -0,0 +1,64 @@
+from django.db.models.signals import post_init, post_save, pre_delete, post_delete
+from django.dispatch import receiver
+from .models import GradeGroup, Grade
+from .ranking import record_score_change, record_student_change
+
+
+def _ranking_key(instance):
+    # 지연 로딩된 필드를 건드리지 않도록 __dict__에서 직접 읽음
+    values = instance.__dict__
+    return values.get('grade_group_id'), values.get('subject_id'), values.get('total_score')
+
+
+def _group_info(instance, group_id):
+    if group_id is None:
+        return None
+    if Grade.grade_group.is_cached(instance) and instance.grade_group.pk == group_id:
+        group = instance.grade_group
+        return group.student_id, group.grade, group.semester
+    return GradeGroup.objects.filter(id=group_id).values_list('student_id', 'grade', 'semester').first()
+
+
+@receiver(post_init, sender=Grade)
+def remember_ranking_key(sender, instance, **kwargs):
+    instance._ranking_key = _ranking_key(instance) if instance.pk else None
+
+
+@receiver(post_save, sender=Grade)
+def sync_saved_grade(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields is not None and not {'grade_group', 'subject', 'total_score', 'credits'} & set(update_fields):
+        return
+
+    previous = getattr(instance, '_ranking_key', None)
+    current = _ranking_key(instance)
+    instance._ranking_key = current
+
+    if previous and previous[:2] != current[:2]:
+        info = _group_info(instance, previous[0])
+        if info:
+            record_score_change(*info, previous[1], instance.pk, previous[2], None)
+        previous = None
+
+    info = _group_info(instance, current[0])
+    if info:
+        record_score_change(*info, current[1], instance.pk, previous[2] if previous else None, current[2])
+
+
+@receiver(pre_delete, sender=Grade)
+def remember_deleted_group(sender, instance, **kwargs):
+    # GradeGroup과 함께 삭제될 때는 post_delete 시점에 그룹이 이미 지워졌을 수 있음
+    instance._ranking_group = _group_info(instance, instance.grade_group_id)
+
+
+@receiver(post_delete, sender=Grade)
+def sync_deleted_grade(sender, instance, **kwargs):
+    _, subject_id, score = _ranking_key(instance)
+    info = getattr(instance, '_ranking_group', None)
+    if info:
+        record_score_change(*info, subject_id, instance.pk, score, None)
+
+
+@receiver(post_save, sender=GradeGroup)
+@receiver(post_delete, sender=GradeGroup)
+def sync_cohort_ranking(sender, instance, **kwargs):
+    record_student_change(instance.student_id, instance.grade, instance.semester)
@@ -0,0 +1,126 @@
+import threading
+from bisect import bisect_right
+from collections import defaultdict
+from .models import Grade, ScoreDistribution, CohortRanking
+from .ranking import grade_level_for, weighted_average
+from .cache import cohort_version
+
+# 학년/학기별 정렬된 점수·평균 인덱스를 프로세스 메모리에 보관
+# 성적이 바뀌면 학년/학기 버전이 올라가므로 다음 조회 때 다시 만든다
+_lock = threading.Lock()
+_indexes = {}
+
+
+def _build_index(grade, semester):
+    distributions = dict(ScoreDistribution.objects.filter(
+        grade=grade, semester=semester
+    ).values_list('subject_id', 'scores'))
+
+    averages = defaultdict(list)
+    for school_grade, average in CohortRanking.objects.filter(
+        grade=grade, semester=semester
+    ).values_list('student__classroom__grade', 'average'):
+        averages[school_grade].append(average)
+    for values in averages.values():
+        values.sort()
+
+    return {"distributions": distributions, "averages": dict(averages)}
+
+
+def get_cohort_index(grade, semester):
+    version = cohort_version(grade, semester)
+    index = _indexes.get((grade, semester))
+    if index is None or index["version"] != version:
+        with _lock:
+            index = _indexes.get((grade, semester))
+            if index is None or index["version"] != version:
+                index = {"version": version, **_build_index(grade, semester)}
+                _indexes[(grade, semester)] = index
+    return index
+
+
+def _subject_scores(index, grade, semester, subject_id):
+    scores = index["distributions"].get(subject_id)
+    if scores is None:
+        # 분포가 아직 저장되지 않은 과목은 읽기만 해서 채움
+        scores = sorted(Grade.objects.filter(
+            grade_group__grade=grade,
+            grade_group__semester=semester,
+            subject_id=subject_id
+        ).values_list('total_score', flat=True))
+        index["distributions"][subject_id] = scores
+    return scores
+
+
+def _rank_excluding(values, own, value, margin=0.0):
+    # 자기 자신의 현재 값(own)을 뺀 나머지 중 value보다 큰 값의 수 + 1
+    higher = len(values) - bisect_right(values, value + margin)
+    if own is not None and own > value + margin:
+        higher -= 1
+    return higher + 1
+
+
+def simulate(student, grade_group, grades, changes):
+    # grades: 현재 Grade 목록(subject 로드), changes: {subject_id: 가정 점수 dict}
+    index = get_cohort_index(grade_group.grade, grade_group.semester)
+
+    subjects = []
+    before = []
+    after = []
+    for grade in grades:
+        change = changes.get(grade.subject_id, {})
+        midterm = change.get('midterm', grade.midterm)
+        final = change.get('final', grade.final)
+        performance = change.get('performance', grade.performance)
+        if 'totalScore' in change:
+            total_score = change['totalScore']
+        elif {'midterm', 'final', 'performance'} & set(change):
+            total_score = round((midterm + final + performance) / 3, 1)
+        else:
+            total_score = grade.total_score
+
+        scores = _subject_scores(index, grade_group.grade, grade_group.semester, grade.subject_id)
+        total = len(scores)
+        rank = _rank_excluding(scores, grade.total_score, total_score)
+        grade_level = grade_level_for(rank / total)
+        current_rank = _rank_excluding(scores, grade.total_score, grade.total_score)
+        current_level = grade_level_for(current_rank / total)
+
+        subjects.append({
+            "name": grade.subject.name,
+            "credits": grade.credits,
+            "midterm": midterm,
+            "final": final,
+            "performance": performance,
+            "totalScore": total_score,
+            "rank": f"{rank}/{total}",
+            "gradeLevel": grade_level,
+            "currentTotalScore": grade.total_score,
+            "currentGradeLevel": current_level
+        })
+        before.append((grade.total_score, current_level, grade.credits))
+        after.append((total_score, grade_level, grade.credits))
+
+    current_average, credits = weighted_average((score, credits) for score, _, credits in before)
+    average, _ = weighted_average((score, credits) for score, _, credits in after)
+    if average is None:
+        return None
+
+    school_grade = student.classroom.grade if student.classroom else None
+    averages = index["averages"].get(school_grade, [])
+    total_students = len(averages) if current_average is not None else len(averages) + 1
+    final_rank = _rank_excluding(averages, current_average, average, 1e-6)
+
+    return {
+        "studentId": student.student_id,
+        "grade": grade_group.grade,
+        "semester": grade_group.semester,
+        "subjects": subjects,
+        "finalSummary": {
+            "totalStudents": total_students,
+            "sumTotalScore": round(average, 1),
+            "finalRank": f"{final_rank}/{total_students}",
+            "finalConvertedGrade": round(sum(level * c for _, level, c in after) / credits, 2),
+            "currentConvertedGrade": round(sum(level * c for _, level, c in before) / credits, 2)
+        }
+    }
@@ -0,0 +1,60 @@
+from django.db.models import Avg, Count, F, Max, Min, StdDev, Value
+from django.db.models.functions import Floor, Greatest, Least
+from .models import Grade
+from .ranking import get_distributions, level_thresholds
+
+HISTOGRAM_WIDTH = 10
+HISTOGRAM_BINS = 10
+
+
+def subject_statistics(grade, semester, subject_id):
+    rows = Grade.objects.filter(
+        grade_group__grade=grade,
+        grade_group__semester=semester,
+        subject_id=subject_id
+    )
+    summary = rows.aggregate(
+        count=Count('id'),
+        average=Avg('total_score'),
+        std_dev=StdDev('total_score'),
+        min_score=Min('total_score'),
+        max_score=Max('total_score')
+    )
+    if not summary["count"]:
+        return None
+
+    # 100점은 마지막 구간(90-100)에 포함
+    bucket = Least(Greatest(Floor(F('total_score') / HISTOGRAM_WIDTH), Value(0.0)), Value(HISTOGRAM_BINS - 1.0))
+    counts = {
+        int(index): count
+        for index, count in rows.annotate(bucket=bucket).values('bucket').annotate(count=Count('id')).values_list('bucket', 'count')
+    }
+    histogram = [
+        {
+            "min": index * HISTOGRAM_WIDTH,
+            "max": (index + 1) * HISTOGRAM_WIDTH,
+            "count": counts.get(index, 0)
+        }
+        for index in range(HISTOGRAM_BINS)
+    ]
+
+    # 등급 커트라인: 해당 등급 안에 드는 마지막 등수의 점수
+    scores = get_distributions(grade, semester, [subject_id])[subject_id]
+    total = len(scores)
+    cutoffs = []
+    for level, threshold in enumerate(level_thresholds(total) + [total], start=1):
+        cutoffs.append({
+            "gradeLevel": level,
+            "maxRank": threshold,
+            "minScore": scores[total - threshold] if threshold else None
+        })
+
+    return {
+        "count": summary["count"],
+        "average": round(summary["average"], 2),
+        "stdDev": round(summary["std_dev"], 2),
+        "min": summary["min_score"],
+        "max": summary["max_score"],
+        "histogram": histogram,
+        "cutoffs": cutoffs
+    }
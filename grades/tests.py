@@ -1,3 +1,152 @@
+import random
+from datetime import timedelta
+from unittest import mock
+from django.db import transaction
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from accounts.models import User
+from classrooms.models import Classroom
+from students.models import Student
+from subjects.models import Subject
+from teachers.models import Teacher
+from .models import GradeGroup, Grade, CohortRanking, ScoreDistribution
+from .ranking import compute_cohort, store_cohort, deferred_rankings, record_score_change
 
-# Create your tests here.
+SUBJECTS = ['국어', '수학', '영어', '과학', '사회']
+SCORES = [55.0, 60.0, 70.0, 75.0, 80.0, 85.0, 90.0, 100.0]
+
+
+class IncrementalRankingTest(TestCase):
+    # 성적 수정 시 +1/-1 로 갱신한 저장 등수가 학년 전체 재계산(store_cohort)과 같은지 확인
+
+    @classmethod
+    def setUpTestData(cls):
+        rng = random.Random(3)
+        subjects = [Subject.objects.create(name=name) for name in SUBJECTS]
+        teacher = Teacher.objects.create(
+            user=User.objects.create(username='t1', name='선생', role='teacher', is_active=True),
+            teacher_code='T1'
+        )
+        number = 0
+        for class_number in (1, 2):
+            classroom = Classroom.objects.create(grade=1, class_number=class_number, teacher=teacher if class_number == 1 else None)
+            for student_number in range(1, 7):
+                number += 1
+                student = Student.objects.create(
+                    user=User.objects.create(username=f's{number}', name=f'학생{number}', role='student', is_active=True),
+                    classroom=classroom,
+                    student_number=student_number,
+                    student_id=f'2025{number:04d}'
+                )
+                group = GradeGroup.objects.create(
+                    student=student,
+                    grade='1학년',
+                    semester='1학기',
+                    grade_status='임시저장',
+                    updated_at=timezone.now() - timedelta(days=number)
+                )
+                for subject in subjects:
+                    score = rng.choice(SCORES)
+                    Grade.objects.create(
+                        grade_group=group, subject=subject, credits=rng.choice([2, 3, 4]),
+                        midterm=score, final=score, performance=score, total_score=score
+                    )
+        store_cohort('1학년', '1학기')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.get(username='t1'))
+        self.rng = random.Random(11)
+
+    def assertMatchesStoreCohort(self):
+        result = compute_cohort('1학년', '1학기')
+        stored = dict(
+            (grade_id, (rank, grade_level))
+            for grade_id, rank, grade_level in Grade.objects.filter(
+                grade_group__grade='1학년', grade_group__semester='1학기'
+            ).values_list('id', 'rank', 'grade_level')
+        )
+        expected = {grade_id: (item['rank'], item['grade_level']) for grade_id, item in result['subjects'].items()}
+        self.assertEqual(stored, expected)
+
+        rankings = {
+            student_id: (rank, converted_grade, round(average, 4))
+            for student_id, rank, converted_grade, average in CohortRanking.objects.filter(
+                grade='1학년', semester='1학기'
+            ).values_list('student_id', 'rank', 'converted_grade', 'average')
+        }
+        expected = {
+            student_id: (item['rank'], item['converted_grade'], round(item['average'], 4))
+            for student_id, item in result['students'].items()
+        }
+        self.assertEqual(rankings, expected)
+
+    def patch_scores(self, student):
+        subjects = self.rng.sample(SUBJECTS, 2)
+        response = self.client.patch(f'/api/grades/students/{student.id}', {
+            'grade': '1학년',
+            'semester': '1학기',
+            'subjects': [{'subject': name, 'totalScore': self.rng.choice(SCORES)} for name in subjects]
+        }, format='json')
+        self.assertEqual(response.status_code, 200, response.data)
+
+    def test_single_student_patch_matches_store_cohort(self):
+        student = Student.objects.order_by('id').first()
+        for _ in range(5):
+            self.patch_scores(student)
+            self.assertMatchesStoreCohort()
+
+    def test_multi_student_patches_match_store_cohort(self):
+        students = list(Student.objects.order_by('id'))
+        for _ in range(20):
+            self.patch_scores(self.rng.choice(students))
+        self.assertMatchesStoreCohort()
+
+    def test_model_save_and_delete_match_store_cohort(self):
+        grades = list(Grade.objects.order_by('id'))
+        for grade in self.rng.sample(grades, 6):
+            grade.total_score = self.rng.choice(SCORES)
+            grade.save()
+        self.rng.choice(grades).delete()
+        self.assertMatchesStoreCohort()
+
+    def test_failed_write_discards_pending_changes(self):
+        grade = Grade.objects.order_by('id').first()
+        student_id = grade.grade_group.student_id
+        before = list(Grade.objects.order_by('id').values_list('rank', 'grade_level'))
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic(), deferred_rankings():
+                old = grade.total_score
+                Grade.objects.filter(id=grade.id).update(total_score=100.0)
+                record_score_change(student_id, '1학년', '1학기', grade.subject_id, grade.id, old, 100.0)
+                raise RuntimeError('boom')
+        self.assertEqual(list(Grade.objects.order_by('id').values_list('rank', 'grade_level')), before)
+        self.assertMatchesStoreCohort()
+
+    def test_ranking_error_rolls_back_patch(self):
+        student = Student.objects.order_by('id').first()
+        grade = Grade.objects.get(grade_group__student=student, subject__name='국어')
+        with mock.patch('grades.ranking.flush_changes', side_effect=RuntimeError('boom')):
+            response = self.client.patch(f'/api/grades/students/{student.id}', {
+                'grade': '1학년', 'semester': '1학기', 'subjects': [{'subject': '국어', 'totalScore': 12.0}]
+            }, format='json')
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.data, {"error": "boom"})
+        grade.refresh_from_db()
+        self.assertNotEqual(grade.total_score, 12.0)
+        self.assertMatchesStoreCohort()
+
+    def test_repeated_subject_in_one_request_matches_store_cohort(self):
+        student = Student.objects.order_by('id').last()
+        response = self.client.post(f'/api/grades/students/{student.id}', {
+            'grade': '1학년', 'semester': '1학기', 'gradeStatus': '임시저장', 'updatedAt': timezone.now().isoformat(),
+            'subjects': [
+                {'subject': '국어', 'credits': 3, 'midterm': 90.0, 'final': 90.0, 'performance': 90.0, 'totalScore': 90.0},
+                {'subject': '국어', 'credits': 3, 'midterm': 60.0, 'final': 60.0, 'performance': 60.0, 'totalScore': 60.0}
+            ]
+        }, format='json')
+        self.assertEqual(response.status_code, 200, response.data)
+        scores = ScoreDistribution.objects.get(grade='1학년', semester='1학기', subject__name='국어').scores
+        self.assertEqual(len(scores), Grade.objects.filter(grade_group__grade='1학년', subject__name='국어').count())
+        self.assertMatchesStoreCohort()
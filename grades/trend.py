@@ -0,0 +1,78 @@
+from django.db.models import Count
+from utils.reference_cache import get_subjects
+from .models import GradeGroup, Grade, CohortRanking
+
+
+def build_trend(student):
+    # 저장된 등수 테이블만 읽어 학기별 추이를 만듦 (학기 수와 무관하게 쿼리 수 고정)
+    latest = {}
+    for group_id, grade, semester, grade_status in GradeGroup.objects.filter(
+        student=student
+    ).order_by('updated_at', 'id').values_list('id', 'grade', 'semester', 'grade_status'):
+        latest[(grade, semester)] = (group_id, grade_status)
+
+    periods = sorted(latest)
+    column = {latest[period][0]: index for index, period in enumerate(periods)}
+    grades = list(Grade.objects.filter(grade_group_id__in=column).values_list(
+        'grade_group_id', 'subject_id', 'total_score', 'rank', 'grade_level'
+    ))
+
+    subject_totals = {
+        (grade, semester, subject_id): count
+        for grade, semester, subject_id, count in Grade.objects.filter(
+            grade_group__grade__in={grade for grade, _ in periods},
+            grade_group__semester__in={semester for _, semester in periods},
+            subject_id__in={subject_id for _, subject_id, *_ in grades}
+        ).values('grade_group__grade', 'grade_group__semester', 'subject_id').annotate(
+            count=Count('id')
+        ).values_list('grade_group__grade', 'grade_group__semester', 'subject_id', 'count')
+    }
+
+    school_grade = student.classroom.grade if student.classroom else None
+    rankings = {
+        (ranking.grade, ranking.semester): ranking
+        for ranking in CohortRanking.objects.filter(student=student)
+    }
+    cohort_totals = {
+        (grade, semester): count
+        for grade, semester, count in CohortRanking.objects.filter(
+            grade__in={grade for grade, _ in periods},
+            semester__in={semester for _, semester in periods},
+            student__classroom__grade=school_grade
+        ).values('grade', 'semester').annotate(count=Count('id')).values_list('grade', 'semester', 'count')
+    }
+
+    names = get_subjects()
+    subjects = {}
+    for group_id, subject_id, total_score, rank, grade_level in grades:
+        index = column[group_id]
+        grade, semester = periods[index]
+        series = subjects.setdefault(names[subject_id], {
+            "totalScore": [None] * len(periods),
+            "gradeLevel": [None] * len(periods),
+            "rank": [None] * len(periods)
+        })
+        series["totalScore"][index] = total_score
+        series["gradeLevel"][index] = grade_level
+        if rank is not None:
+            series["rank"][index] = f"{rank}/{subject_totals[(grade, semester, subject_id)]}"
+
+    semesters = []
+    for grade, semester in periods:
+        ranking = rankings.get((grade, semester))
+        total = cohort_totals.get((grade, semester), 0)
+        semesters.append({
+            "grade": grade,
+            "semester": semester,
+            "gradeStatus": latest[(grade, semester)][1],
+            "average": round(ranking.average, 1) if ranking else None,
+            "finalRank": f"{ranking.rank}/{total}" if ranking and ranking.rank else None,
+            "convertedGrade": ranking.converted_grade if ranking else None
+        })
+
+    return {
+        "studentId": student.student_id,
+        "studentName": student.user.name,
+        "semesters": semesters,
+        "subjects": subjects
+    }
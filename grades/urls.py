@@ -3,7 +3,14 @@ from . import views
 
 urlpatterns = [
     path('management-status', views.GradeManagementStatusView.as_view(), name='grade-management-status'),
+    path('status-board', views.GradeStatusBoardView.as_view(), name='grade-status-board'),
     path('students/<int:student_id>/overview', views.GradeOverviewView.as_view(), name='grade-overview'),
+    path('students/<int:student_id>/trend', views.GradeTrendView.as_view(), name='grade-trend'),
+    path('students/<int:student_id>/simulate', views.GradeSimulationView.as_view(), name='grade-simulate'),
     path('students/<int:student_id>', views.GradeUpdateView.as_view(), name='grade-update'),
+    path('bulk', views.GradeBulkUploadView.as_view(), name='grade-bulk-upload'),
+    path('matrix', views.GradeMatrixView.as_view(), name='grade-matrix'),
+    path('statistics', views.GradeSubjectStatisticsView.as_view(), name='grade-subject-statistics'),
+    path('overview-cache/stats', views.GradeOverviewCacheStatsView.as_view(), name='grade-overview-cache-stats'),
     path('input-period', views.GradeInputPeriodView.as_view(), name='grade-input-period'),
 ]
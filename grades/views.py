@@ -1,11 +1,35 @@
+import csv
+import io
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from .models import GradeGroup, Grade
 from students.models import Student
 from classrooms.models import Classroom
-from .serializers import GradeStudentStatusSerializer, GradeInputSerializer
+from .serializers import (
+    GradeStudentStatusSerializer, GradeInputSerializer, GradeBulkUploadSerializer, GradeBulkRowSerializer,
+    GradeMatrixSerializer, GradeMatrixCellSerializer, GradeSimulationSerializer, GradeSimulationSubjectSerializer
+)
+from .ranking import (
+    get_distributions, rank_in_distribution, get_cohort_rank,
+    store_cohort, deferred_rankings, record_score_change
+)
+from .overview import build_overview
+from .matrix import load_matrix, apply_matrix_cells
+from .trend import build_trend
+from .simulation import simulate
+from .board import build_status_board
+from .cache import (
+    get_cached_overview, cache_overview, overview_cache_stats, get_cached_statistics, cache_statistics
+)
+from .statistics import subject_statistics
+from utils.reference_cache import get_subject_id, get_subject_ids, get_classroom_id
 from django.shortcuts import get_object_or_404
+from django.http import Http404
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from datetime import datetime
 from rest_framework.permissions import IsAuthenticated
 from utils.slack import send_success_slack, send_error_slack
@@ -21,35 +45,78 @@ class GradeManagementStatusView(APIView):
             grade = request.query_params.get("grade")
             class_ = request.query_params.get("class")
             semester = request.query_params.get("semester")
+            page = request.query_params.get("page")
+            page_size = request.query_params.get("pageSize")
 
-            students = Student.objects.all()
+            latest_group = GradeGroup.objects.filter(student=OuterRef('pk'))
+            if semester:
+                latest_group = latest_group.filter(semester=semester)
+
+            students = Student.objects.select_related('user', 'classroom').annotate(
+                grade_status=Coalesce(
+                    Subquery(latest_group.order_by('-updated_at').values('grade_status')[:1]),
+                    Value('미입력')
+                )
+            ).order_by('id')
             if grade:
                 students = students.filter(classroom__grade=grade)
             if class_:
                 students = students.filter(classroom__class_number=class_)
 
-            result = []
-            for student in students:
-                group_qs = GradeGroup.objects.filter(student=student)
-                if semester:
-                    group_qs = group_qs.filter(semester=semester)
-                group = group_qs.order_by('-updated_at').first()
-                student.gradeStatus = group.grade_status if group else '미입력'
-                result.append(student)
+            pagination = None
+            if page:
+                page_size = max(1, min(int(page_size or 50), 200))
+                page_obj = Paginator(students, page_size).get_page(page)
+                students = page_obj.object_list
+                pagination = {
+                    "page": page_obj.number,
+                    "pageSize": page_size,
+                    "totalCount": page_obj.paginator.count,
+                    "totalPages": page_obj.paginator.num_pages,
+                    "hasNext": page_obj.has_next()
+                }
 
-            serializer = GradeStudentStatusSerializer(result, many=True)
+            serializer = GradeStudentStatusSerializer(students, many=True)
             send_success_slack(request, "성적 목록 조회", start_time)
-            return Response({
+            data = {
                 "semesterPeriod": {
                     "start": "2025-05-01",
                     "end": "2025-06-16"
                 },
                 "students": serializer.data
-            })
+            }
+            if pagination:
+                data["pagination"] = pagination
+            return Response(data)
         except Exception as e:
             send_error_slack(request, "성적 목록 조회", start_time)
             return Response({"error": str(e)}, status=500)
 
+class GradeStatusBoardView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        start_time = datetime.now()
+        try:
+            grade = request.query_params.get("grade")
+            semester = request.query_params.get("semester")
+            if not grade:
+                send_error_slack(request, "성적 입력 현황판 조회", start_time)
+                return Response({"error": "grade가 필요합니다."}, status=400)
+            if semester:
+                semester = f"{semester}학기" if '학기' not in semester else semester
+
+            classrooms = build_status_board(int(grade), semester)
+            send_success_slack(request, "성적 입력 현황판 조회", start_time)
+            return Response({
+                "grade": int(grade),
+                "semester": semester,
+                "classrooms": classrooms
+            })
+        except Exception as e:
+            send_error_slack(request, "성적 입력 현황판 조회", start_time)
+            return Response({"error": str(e)}, status=500)
+
 class GradeUpdateView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -60,23 +127,25 @@ class GradeUpdateView(APIView):
             serializer = GradeInputSerializer(data=request.data)
             if serializer.is_valid():
                 data = serializer.validated_data
-                group = GradeGroup.objects.create(
-                    student=student,
-                    grade=data['grade'],
-                    semester=data['semester'],
-                    grade_status=data['gradeStatus'],
-                    updated_at=data['updatedAt']
-                )
-                for item in data['subjects']:
-                    Grade.objects.create(
-                        grade_group=group,
-                        subject_id=self.get_subject_id_by_name(item['subject']),
-                        credits=item['credits'],
-                        midterm=item['midterm'],
-                        final=item['final'],
-                        performance=item['performance'],
-                        total_score=item['totalScore']
+                # 성적 저장과 석차 갱신을 한 트랜잭션으로 처리
+                with transaction.atomic(), deferred_rankings():
+                    group = GradeGroup.objects.create(
+                        student=student,
+                        grade=data['grade'],
+                        semester=data['semester'],
+                        grade_status=data['gradeStatus'],
+                        updated_at=data['updatedAt']
                     )
+                    for item in data['subjects']:
+                        Grade.objects.create(
+                            grade_group=group,
+                            subject_id=self.get_subject_id_by_name(item['subject']),
+                            credits=item['credits'],
+                            midterm=item['midterm'],
+                            final=item['final'],
+                            performance=item['performance'],
+                            total_score=item['totalScore']
+                        )
                 send_success_slack(request, "성적 등록", start_time)
                 return Response({"message": "Grades submitted successfully"}, status=200)
             send_error_slack(request, "성적 등록", start_time)
@@ -95,33 +164,45 @@ class GradeUpdateView(APIView):
                 return Response({"error": "Invalid input"}, status=400)
             
             data = serializer.validated_data
-            grade_group = GradeGroup.objects.filter(student=student).order_by('-updated_at').first()
+            group_qs = GradeGroup.objects.filter(student=student)
+            if 'grade' in data:
+                group_qs = group_qs.filter(grade=data['grade'])
+            if 'semester' in data:
+                group_qs = group_qs.filter(semester=data['semester'])
+            grade_group = group_qs.order_by('-updated_at').first()
             if not grade_group:
                 send_error_slack(request, "성적 수정", start_time)
                 return Response({"error": "성적 정보가 없습니다."}, status=404)
 
-            if 'gradeStatus' in data:
-                grade_group.grade_status = data['gradeStatus']
-            if 'updatedAt' in data:
-                grade_group.updated_at = data['updatedAt']
-            grade_group.save()
-
-            if 'subjects' in data:
-                for item in data['subjects']:
-                    subject_name = item.get('subject')
-                    from subjects.models import Subject
-                    subject = get_object_or_404(Subject, name=subject_name)
-
-                    grade = Grade.objects.filter(grade_group=grade_group, subject=subject).first()
-                    if not grade:
-                        continue
-
-                    grade.credits = item.get('credits', grade.credits)
-                    grade.midterm = item.get('midterm', grade.midterm)
-                    grade.final = item.get('final', grade.final)
-                    grade.performance = item.get('performance', grade.performance)
-                    grade.total_score = item.get('totalScore', grade.total_score)
-                    grade.save()
+            with transaction.atomic(), deferred_rankings():
+                if 'gradeStatus' in data:
+                    grade_group.grade_status = data['gradeStatus']
+                if 'updatedAt' in data:
+                    grade_group.updated_at = data['updatedAt']
+                grade_group.save()
+
+                if 'subjects' in data:
+                    items = {self.get_subject_id_by_name(item.get('subject')): item for item in data['subjects']}
+                    grades = list(Grade.objects.filter(grade_group=grade_group, subject_id__in=items))
+                    previous_scores = {}
+                    for grade in grades:
+                        item = items[grade.subject_id]
+                        previous_scores[grade.id] = grade.total_score
+                        grade.credits = item.get('credits', grade.credits)
+                        grade.midterm = item.get('midterm', grade.midterm)
+                        grade.final = item.get('final', grade.final)
+                        grade.performance = item.get('performance', grade.performance)
+                        grade.total_score = item.get('totalScore', grade.total_score)
+                    Grade.objects.bulk_update(
+                        grades, ['credits', 'midterm', 'final', 'performance', 'total_score']
+                    )
+
+                    # bulk_update는 시그널을 보내지 않으므로 석차 갱신을 직접 기록
+                    for grade in grades:
+                        record_score_change(
+                            student.id, grade_group.grade, grade_group.semester,
+                            grade.subject_id, grade.id, previous_scores[grade.id], grade.total_score
+                        )
 
             send_success_slack(request, "성적 수정", start_time)
             return Response({"message": "Grades patched successfully"}, status=200)
@@ -130,9 +211,102 @@ class GradeUpdateView(APIView):
             return Response({"error": str(e)}, status=500)
 
     def get_subject_id_by_name(self, name):
-        from subjects.models import Subject
-        subject = get_object_or_404(Subject, name=name)
-        return subject.id
+        subject_id = get_subject_id(name)
+        if subject_id is None:
+            raise Http404("No Subject matches the given query.")
+        return subject_id
+
+class GradeBulkUploadView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        start_time = datetime.now()
+        try:
+            header = GradeBulkUploadSerializer(data=request.data)
+            if not header.is_valid():
+                send_error_slack(request, "성적 일괄 등록", start_time)
+                return Response({"error": "Invalid input", "details": header.errors}, status=400)
+            meta = header.validated_data
+
+            upload = request.FILES.get("file")
+            if upload:
+                rows = list(csv.DictReader(io.TextIOWrapper(upload.file, encoding='utf-8-sig')))
+            else:
+                rows = request.data.get("grades") or []
+
+            errors = []
+            valid_rows = []
+            for index, row in enumerate(rows, start=1):
+                row_serializer = GradeBulkRowSerializer(data=row)
+                if row_serializer.is_valid():
+                    valid_rows.append((index, row_serializer.validated_data))
+                else:
+                    errors.append({"row": index, "errors": row_serializer.errors})
+
+            student_codes = {item['studentId'] for _, item in valid_rows}
+            subject_names = {item['subject'] for _, item in valid_rows}
+            students = dict(Student.objects.filter(student_id__in=student_codes).values_list('student_id', 'id'))
+            subjects = get_subject_ids(subject_names)
+
+            seen = set()
+            for index, item in valid_rows:
+                row_errors = {}
+                if item['studentId'] not in students:
+                    row_errors['studentId'] = ["해당 학생이 존재하지 않습니다."]
+                if item['subject'] not in subjects:
+                    row_errors['subject'] = ["해당 과목이 존재하지 않습니다."]
+                key = (item['studentId'], item['subject'])
+                if key in seen:
+                    row_errors['subject'] = ["같은 학생의 과목이 중복되었습니다."]
+                seen.add(key)
+                if row_errors:
+                    errors.append({"row": index, "errors": row_errors})
+
+            if not rows or errors:
+                send_error_slack(request, "성적 일괄 등록", start_time)
+                return Response({
+                    "error": "Invalid rows" if rows else "No rows",
+                    "rows": sorted(errors, key=lambda e: e["row"])
+                }, status=400)
+
+            with transaction.atomic():
+                groups = {}
+                for _, item in valid_rows:
+                    student_id = students[item['studentId']]
+                    if student_id not in groups:
+                        groups[student_id] = GradeGroup(
+                            student_id=student_id,
+                            grade=meta['grade'],
+                            semester=meta['semester'],
+                            grade_status=meta['gradeStatus'],
+                            updated_at=meta['updatedAt']
+                        )
+                GradeGroup.objects.bulk_create(groups.values())
+
+                Grade.objects.bulk_create([
+                    Grade(
+                        grade_group=groups[students[item['studentId']]],
+                        subject_id=subjects[item['subject']],
+                        credits=item['credits'],
+                        midterm=item['midterm'],
+                        final=item['final'],
+                        performance=item['performance'],
+                        total_score=item['totalScore']
+                    )
+                    for _, item in valid_rows
+                ])
+
+                store_cohort(meta['grade'], meta['semester'])
+
+            send_success_slack(request, "성적 일괄 등록", start_time)
+            return Response({
+                "message": "Grades uploaded successfully",
+                "students": len(groups),
+                "grades": len(valid_rows)
+            }, status=201)
+        except Exception as e:
+            send_error_slack(request, "성적 일괄 등록", start_time)
+            return Response({"error": str(e)}, status=500)
 
 from utils.slack import send_success_slack, send_error_slack
 from datetime import datetime
@@ -160,115 +334,217 @@ class GradeOverviewView(APIView):
                 send_error_slack(request, "성적 상세 조회", start_time)
                 return Response({"error": "성적 정보가 없습니다."}, status=404)
 
-            grades = grade_group.grades.select_related('subject')
-            subject_results = []
-            total_credits = 0
-            weighted_total_score = 0
-            weighted_grade_sum = 0
-
+            cached = get_cached_overview(student.id, grade_group.grade, grade_group.semester)
+            if cached is not None:
+                send_success_slack(request, "성적 상세 조회", start_time)
+                return Response(cached)
+
+            grades = list(grade_group.grades.select_related('subject'))
+            distributions = get_distributions(
+                grade_group.grade,
+                grade_group.semester,
+                [g.subject_id for g in grades]
+            )
+            subject_ranks = {}
             for grade in grades:
-                subject_name = grade.subject.name
-                credits = grade.credits
-                total_score = grade.total_score
-
-                all_scores = list(Grade.objects.filter(
-                    grade_group__semester=grade_group.semester,
-                    grade_group__grade=grade_group.grade,
-                    subject=grade.subject
-                ).values_list('total_score', flat=True))
-
-                all_scores.sort(reverse=True)
-                rank = sum(1 for s in all_scores if s > total_score) + 1
-                percentile = rank / len(all_scores)
-
-                if percentile <= 0.04:
-                    grade_level = 1
-                elif percentile <= 0.11:
-                    grade_level = 2
-                elif percentile <= 0.23:
-                    grade_level = 3
-                elif percentile <= 0.40:
-                    grade_level = 4
-                elif percentile <= 0.60:
-                    grade_level = 5
-                elif percentile <= 0.77:
-                    grade_level = 6
-                elif percentile <= 0.89:
-                    grade_level = 7
-                elif percentile <= 0.96:
-                    grade_level = 8
-                else:
-                    grade_level = 9
-
-                subject_results.append({
-                    "name": subject_name,
-                    "credits": credits,
-                    "midterm": grade.midterm,
-                    "final": grade.final,
-                    "performance": grade.performance,
-                    "totalScore": total_score,
-                    "rank": f"{rank}/{len(all_scores)}",
-                    "gradeLevel": grade_level
-                })
-
-                total_credits += credits
-                weighted_total_score += total_score * credits
-                weighted_grade_sum += grade_level * credits
-
-            sum_midterm = sum([g.midterm for g in grades]) / len(grades)
-            sum_final = sum([g.final for g in grades]) / len(grades)
-            sum_performance = sum([g.performance for g in grades]) / len(grades)
-            sum_total_score = weighted_total_score / total_credits
-            converted_grade = round(weighted_grade_sum / total_credits, 2)
-
-            all_totals = []
-            same_grade_students = Student.objects.filter(classroom__grade=student.classroom.grade)
-            for s in same_grade_students:
-                ggroup = GradeGroup.objects.filter(student=s, semester=grade_group.semester, grade=grade_group.grade).order_by('-updated_at').first()
-                if not ggroup:
-                    continue
-                ggrades = ggroup.grades.all()
-                g_total = sum(gr.total_score * gr.credits for gr in ggrades)
-                g_credits = sum(gr.credits for gr in ggrades)
-                if g_credits > 0:
-                    all_totals.append(g_total / g_credits)
-
-            all_totals.sort(reverse=True)
-            my_rank = next((i + 1 for i, score in enumerate(all_totals) if abs(score - sum_total_score) < 1e-6), None)
+                all_scores = distributions[grade.subject_id]
+                subject_ranks[grade.id] = (rank_in_distribution(all_scores, grade.total_score), len(all_scores))
+
+            sum_total_score = sum(g.total_score * g.credits for g in grades) / sum(g.credits for g in grades)
+            my_rank, total_students = get_cohort_rank(
+                student, grade_group.grade, grade_group.semester, sum_total_score
+            )
             if my_rank is None:
                 send_error_slack(request, "성적 상세 조회", start_time)
                 return Response({"error": "등수를 계산할 수 없습니다."}, status=500)
 
+            data = build_overview(student, grades, subject_ranks, (my_rank, total_students))
+            cache_overview(student.id, grade_group.grade, grade_group.semester, data)
             send_success_slack(request, "성적 상세 조회", start_time)
-            return Response({
-                "studentId": student.student_id,
-                "studentName": student.user.name,
-                "grade": student.classroom.grade if student.classroom else None,
-                "classNumber": student.classroom.class_number if student.classroom else None,
-                "number": student.student_number,
-                "subjects": subject_results,
-                "totals": {
-                    "totalCredits": total_credits,
-                    "sumMidterm": round(sum_midterm, 1),
-                    "sumFinal": round(sum_final, 1),
-                    "sumPerformance": round(sum_performance, 1),
-                    "sumTotalScore": round(sum_total_score, 1)
-                },
-                "finalSummary": {
-                    "totalStudents": len(all_totals),
-                    "finalRank": f"{my_rank}/{len(all_totals)}",
-                    "finalConvertedGrade": converted_grade
-                },
-                "radarChart": {
-                    "labels": [s["name"] for s in subject_results],
-                    "data": [s["totalScore"] for s in subject_results]
-                }
-            })
+            return Response(data)
         except Exception as e:
             send_error_slack(request, "성적 상세 조회", start_time)
             return Response({"error": str(e)}, status=500)
 
 
+class GradeTrendView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, student_id):
+        start_time = datetime.now()
+        try:
+            student = get_object_or_404(Student.objects.select_related('user', 'classroom'), id=student_id)
+            data = build_trend(student)
+            if not data["semesters"]:
+                send_error_slack(request, "성적 추이 조회", start_time)
+                return Response({"error": "성적 정보가 없습니다."}, status=404)
+            send_success_slack(request, "성적 추이 조회", start_time)
+            return Response(data)
+        except Exception as e:
+            send_error_slack(request, "성적 추이 조회", start_time)
+            return Response({"error": str(e)}, status=500)
+
+
+class GradeSimulationView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, student_id):
+        start_time = datetime.now()
+        try:
+            serializer = GradeSimulationSerializer(data=request.data)
+            if not serializer.is_valid():
+                send_error_slack(request, "성적 시뮬레이션", start_time)
+                return Response({"error": "Invalid input", "details": serializer.errors}, status=400)
+            data = serializer.validated_data
+
+            changes = {}
+            for item in data['subjects']:
+                item_serializer = GradeSimulationSubjectSerializer(data=item)
+                if not item_serializer.is_valid():
+                    send_error_slack(request, "성적 시뮬레이션", start_time)
+                    return Response({"error": "Invalid input", "details": item_serializer.errors}, status=400)
+                change = item_serializer.validated_data
+                subject_id = get_subject_id(change['subject'])
+                if subject_id is None:
+                    send_error_slack(request, "성적 시뮬레이션", start_time)
+                    return Response({"error": f"해당 과목이 존재하지 않습니다: {change['subject']}"}, status=400)
+                changes[subject_id] = change
+
+            student = get_object_or_404(Student.objects.select_related('classroom'), id=student_id)
+            group_qs = GradeGroup.objects.filter(student=student)
+            if 'grade' in data:
+                grade = data['grade']
+                group_qs = group_qs.filter(grade=f"{grade}학년" if '학년' not in grade else grade)
+            if 'semester' in data:
+                semester = data['semester']
+                group_qs = group_qs.filter(semester=f"{semester}학기" if '학기' not in semester else semester)
+            grade_group = group_qs.order_by('-updated_at').first()
+            if not grade_group:
+                send_error_slack(request, "성적 시뮬레이션", start_time)
+                return Response({"error": "성적 정보가 없습니다."}, status=404)
+
+            grades = list(grade_group.grades.select_related('subject'))
+            missing = set(changes) - {g.subject_id for g in grades}
+            if missing:
+                send_error_slack(request, "성적 시뮬레이션", start_time)
+                return Response({"error": "성적이 없는 과목은 시뮬레이션할 수 없습니다."}, status=400)
+
+            result = simulate(student, grade_group, grades, changes)
+            if result is None:
+                send_error_slack(request, "성적 시뮬레이션", start_time)
+                return Response({"error": "등수를 계산할 수 없습니다."}, status=500)
+            send_success_slack(request, "성적 시뮬레이션", start_time)
+            return Response(result)
+        except Exception as e:
+            send_error_slack(request, "성적 시뮬레이션", start_time)
+            return Response({"error": str(e)}, status=500)
+
+
+class GradeOverviewCacheStatsView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return Response(overview_cache_stats())
+
+
+class GradeSubjectStatisticsView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        start_time = datetime.now()
+        try:
+            grade = request.query_params.get("grade")
+            semester = request.query_params.get("semester")
+            subject = request.query_params.get("subject")
+            if not grade or not semester or not subject:
+                send_error_slack(request, "과목 통계 조회", start_time)
+                return Response({"error": "grade, semester, subject가 필요합니다."}, status=400)
+
+            grade = f"{grade}학년" if '학년' not in grade else grade
+            semester = f"{semester}학기" if '학기' not in semester else semester
+            subject_id = get_subject_id(subject)
+            if subject_id is None:
+                send_error_slack(request, "과목 통계 조회", start_time)
+                return Response({"error": "해당 과목이 존재하지 않습니다."}, status=404)
+
+            data = get_cached_statistics(grade, semester, subject_id)
+            if data is None:
+                statistics = subject_statistics(grade, semester, subject_id)
+                if statistics is None:
+                    send_error_slack(request, "과목 통계 조회", start_time)
+                    return Response({"error": "성적 정보가 없습니다."}, status=404)
+                data = {"grade": grade, "semester": semester, "subject": subject, **statistics}
+                cache_statistics(grade, semester, subject_id, data)
+
+            send_success_slack(request, "과목 통계 조회", start_time)
+            return Response(data)
+        except Exception as e:
+            send_error_slack(request, "과목 통계 조회", start_time)
+            return Response({"error": str(e)}, status=500)
+
+
+class GradeMatrixView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        start_time = datetime.now()
+        try:
+            grade = request.query_params.get("grade")
+            class_ = request.query_params.get("class")
+            semester = request.query_params.get("semester")
+            classroom_id = get_classroom_id(grade, class_)
+            if classroom_id is None or not semester:
+                send_error_slack(request, "반 성적표 조회", start_time)
+                return Response({"error": "grade, class, semester가 필요합니다."}, status=400)
+
+            semester = f"{semester}학기" if '학기' not in semester else semester
+            data = load_matrix(classroom_id, f"{int(grade)}학년", semester)
+            send_success_slack(request, "반 성적표 조회", start_time)
+            return Response(data)
+        except Exception as e:
+            send_error_slack(request, "반 성적표 조회", start_time)
+            return Response({"error": str(e)}, status=500)
+
+    def patch(self, request):
+        start_time = datetime.now()
+        try:
+            serializer = GradeMatrixSerializer(data=request.data)
+            if not serializer.is_valid():
+                send_error_slack(request, "반 성적표 수정", start_time)
+                return Response({"error": "Invalid input", "details": serializer.errors}, status=400)
+            data = serializer.validated_data
+            classroom_id = get_classroom_id(data['grade'], data['classNumber'])
+            if classroom_id is None:
+                send_error_slack(request, "반 성적표 수정", start_time)
+                return Response({"error": "해당 반이 존재하지 않습니다."}, status=404)
+
+            errors = []
+            cells = []
+            for index, cell in enumerate(data['cells'], start=1):
+                cell_serializer = GradeMatrixCellSerializer(data=cell)
+                if cell_serializer.is_valid():
+                    cells.append((index, cell_serializer.validated_data))
+                else:
+                    errors.append({"row": index, "errors": cell_serializer.errors})
+
+            semester = data['semester']
+            semester = f"{semester}학기" if '학기' not in semester else semester
+            if not errors:
+                errors, result = apply_matrix_cells(classroom_id, f"{data['grade']}학년", semester, cells)
+            if not cells or errors:
+                send_error_slack(request, "반 성적표 수정", start_time)
+                return Response({
+                    "error": "Invalid cells" if data['cells'] else "No cells",
+                    "rows": errors
+                }, status=400)
+
+            send_success_slack(request, "반 성적표 수정", start_time)
+            return Response({"message": "Grades patched successfully", **result})
+        except Exception as e:
+            send_error_slack(request, "반 성적표 수정", start_time)
+            return Response({"error": str(e)}, status=500)
+
+
 class GradeInputPeriodView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -0,0 +1,32 @@
+import os
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from reports.report_cards import generate_report_cards
+
+
+class Command(BaseCommand):
+    help = "학년/학기 전체 학생의 성적표 파일을 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grade', required=True, help="예: 1학년")
+        parser.add_argument('--semester', required=True, help="예: 1학기")
+        parser.add_argument('--output', help="기본값: settings.REPORT_CARD_ROOT")
+        parser.add_argument('--workers', type=int, help="기본값: CPU 수")
+        parser.add_argument('--format', choices=['html', 'json'], default='html')
+
+    def handle(self, *args, **options):
+        try:
+            result = generate_report_cards(
+                options['grade'],
+                options['semester'],
+                output_dir=options['output'],
+                workers=os.cpu_count() or 1 if options['workers'] is None else options['workers'],
+                fmt=options['format']
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+        self.stdout.write(self.style.SUCCESS(
+            f"{result['grade']} {result['semester']}: {result['students']}명 성적표 생성 "
+            f"({result['elapsedSeconds']}s, {result['studentsPerSecond']} students/s) -> "
+            f"{os.path.join(options['output'] or settings.REPORT_CARD_ROOT, result['outputDir'])}"
+        ))
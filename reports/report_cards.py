@@ -0,0 +1,102 @@
+import json
+import os
+import re
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import django
+from django.conf import settings
+from django.template.loader import render_to_string
+from grades.models import Grade
+from grades.overview import build_overview
+from grades.ranking import compute_cohort
+from students.models import Student
+
+# 학년/학기 값은 출력 디렉터리 이름에 그대로 쓰이므로 형식을 제한
+GRADE_PATTERN = re.compile(r"[1-9]학년")
+SEMESTER_PATTERN = re.compile(r"[1-9]학기")
+
+
+def build_report_cards(grade, semester):
+    # 학년/학기 성적을 한번만 읽어 전체 학생의 성적표 데이터를 만든다
+    result = compute_cohort(grade, semester)
+    cohort = result["students"]
+
+    grades_by_group = defaultdict(list)
+    for row in Grade.objects.filter(
+        grade_group_id__in=[item["grade_group_id"] for item in cohort.values()]
+    ).select_related('subject').order_by('id'):
+        grades_by_group[row.grade_group_id].append(row)
+
+    students = Student.objects.filter(id__in=cohort).select_related('user', 'classroom')
+
+    cards = []
+    for student in students:
+        item = cohort[student.id]
+        grades = grades_by_group[item["grade_group_id"]]
+        subject_ranks = {
+            g.id: (result["subjects"][g.id]["rank"], result["subjects"][g.id]["total"])
+            for g in grades
+        }
+        cards.append(build_overview(student, grades, subject_ranks, (item["rank"], item["total"])))
+    return cards
+
+
+def render_report_card(job):
+    path, card, fmt = job
+    if fmt == "html":
+        content = render_to_string("reports/report_card.html", {"card": card})
+    else:
+        content = json.dumps(card, ensure_ascii=False, indent=2)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return path
+
+
+def worker_count(workers):
+    # 1 이상, CPU 수 이하로 제한
+    if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+        raise ValueError("workers는 1 이상의 정수여야 합니다.")
+    return min(workers, os.cpu_count() or 1)
+
+
+def report_card_dir(root, grade, semester):
+    # root 아래의 "<학년>_<학기>" 디렉터리, root 밖을 가리키면 ValueError
+    if not GRADE_PATTERN.fullmatch(str(grade)) or not SEMESTER_PATTERN.fullmatch(str(semester)):
+        raise ValueError("grade는 '1학년', semester는 '1학기' 형식이어야 합니다.")
+    root = os.path.realpath(root)
+    path = os.path.realpath(os.path.join(root, f"{grade}_{semester}"))
+    if os.path.commonpath([root, path]) != root:
+        raise ValueError("출력 경로가 올바르지 않습니다.")
+    return root, path
+
+
+def generate_report_cards(grade, semester, output_dir=None, workers=1, fmt="html"):
+    started = time.monotonic()
+    workers = worker_count(workers)
+    root, output_dir = report_card_dir(output_dir or settings.REPORT_CARD_ROOT, grade, semester)
+    os.makedirs(output_dir, exist_ok=True)
+
+    cards = build_report_cards(grade, semester)
+    jobs = [
+        (os.path.join(output_dir, f"{card['studentId']}.{fmt}"), card, fmt)
+        for card in cards
+    ]
+
+    if workers == 1 or len(jobs) <= 1:
+        files = [render_report_card(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as executor:
+            files = list(executor.map(render_report_card, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+    elapsed = time.monotonic() - started
+    return {
+        "grade": grade,
+        "semester": semester,
+        "students": len(cards),
+        "files": len(files),
+        # 서버 절대 경로는 노출하지 않고 출력 루트 기준 상대 경로만 반환
+        "outputDir": os.path.relpath(output_dir, root),
+        "elapsedSeconds": round(elapsed, 3),
+        "studentsPerSecond": round(len(cards) / elapsed, 1) if elapsed > 0 else None
+    }
@@ -5,4 +5,5 @@ urlpatterns = [
     #path('grades/', views.GradeReportView.as_view()),
     #path('feedbacks/', views.FeedbackReportView.as_view()),
     #path('consultations/', views.ConsultationReportView.as_view()),
+    path('report-cards', views.ReportCardGenerateView.as_view()),
 ]
@@ -1,3 +1,34 @@
-from django.shortcuts import render
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from utils.slack import send_success_slack, send_error_slack
+from datetime import datetime
+from .report_cards import generate_report_cards
 
-# Create your views here.
+
+class ReportCardGenerateView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        start_time = datetime.now()
+        try:
+            grade = request.data.get("grade")
+            semester = request.data.get("semester")
+            fmt = request.data.get("format", "html")
+            if not grade or not semester or fmt not in ("html", "json"):
+                send_error_slack(request, "성적표 일괄 생성", start_time)
+                return Response({"error": "grade와 semester는 필수입니다."}, status=400)
+
+            grade = f"{grade}학년" if '학년' not in str(grade) else grade
+            semester = f"{semester}학기" if '학기' not in str(semester) else semester
+            # 웹 워커 안에서는 프로세스 풀을 띄우지 않음, 병렬 생성은 generate_report_cards 명령으로
+            result = generate_report_cards(grade, semester, fmt=fmt)
+
+            send_success_slack(request, "성적표 일괄 생성", start_time)
+            return Response(result, status=201)
+        except ValueError as e:
+            send_error_slack(request, "성적표 일괄 생성", start_time)
+            return Response({"error": str(e)}, status=400)
+        except Exception as e:
+            send_error_slack(request, "성적표 일괄 생성", start_time)
+            return Response({"error": str(e)}, status=500)
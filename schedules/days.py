@@ -0,0 +1,162 @@
+import threading
+import time
+from datetime import date, timedelta
+from django.core.cache import cache
+
+# 학년도는 3월 1일부터 다음해 2월 말까지 (최대 366일)
+CALENDAR_DAYS = 366
+CALENDAR_BYTES = (CALENDAR_DAYS + 7) // 8
+VERSION_KEY = "schedules:version"
+# 공유 버전은 이 간격으로만 다시 확인 (같은 프로세스의 변경은 invalidate()가 바로 반영)
+RECHECK_SECONDS = 5
+
+_lock = threading.Lock()
+_snapshot = {"version": None, "checked_at": 0.0, "years": {}}
+
+
+def school_year(day):
+    # 학년도는 3월에 시작 (1~2월은 전년도)
+    return day.year if day.month >= 3 else day.year - 1
+
+
+def year_start(year):
+    return date(year, 3, 1)
+
+
+def year_length(year):
+    return (year_start(year + 1) - year_start(year)).days
+
+
+def day_index(year, day):
+    index = (day - year_start(year)).days
+    return index if 0 <= index < year_length(year) else None
+
+
+def index_date(year, index):
+    return year_start(year) + timedelta(days=index)
+
+
+def range_mask(year, start, end):
+    # start~end (포함) 구간의 비트 마스크, 학년도 밖은 잘라냄
+    first = max((start - year_start(year)).days, 0)
+    last = min((end - year_start(year)).days, year_length(year) - 1)
+    if first > last:
+        return 0
+    return ((1 << (last - first + 1)) - 1) << first
+
+
+def to_bits(value):
+    return int.from_bytes(bytes(value), 'little')
+
+
+def from_bits(bits):
+    return bits.to_bytes(CALENDAR_BYTES, 'little')
+
+
+def weekday_mask(year):
+    mask = 0
+    for index in range(year_length(year)):
+        if index_date(year, index).weekday() < 5:
+            mask |= 1 << index
+    return mask
+
+
+def build_year(year):
+    # 학기 기간 안의 주중에서 휴업일을 뺀 날이 수업일
+    from .models import Term, CalendarEvent, InstructionalYear
+
+    terms = list(Term.objects.filter(year=year).values_list('start_date', 'end_date'))
+    events = CalendarEvent.objects.filter(
+        date__gte=year_start(year), date__lt=year_start(year + 1)
+    ).values_list('date', 'event_type')
+    holidays = sorted(day for day, event_type in events if event_type == 'holiday')
+    exam_days = sorted(day for day, event_type in events if event_type == 'exam')
+
+    if not terms and not holidays and not exam_days:
+        InstructionalYear.objects.filter(year=year).delete()
+        return None
+
+    bits = 0
+    for start, end in terms:
+        bits |= range_mask(year, start, end)
+    bits &= weekday_mask(year)
+    for day in holidays:
+        bits &= ~(1 << day_index(year, day))
+
+    row, _ = InstructionalYear.objects.update_or_create(year=year, defaults={
+        "total_days": bits.bit_count(),
+        "days": from_bits(bits),
+        "holidays": [day.isoformat() for day in holidays],
+        "exam_days": [day.isoformat() for day in exam_days],
+    })
+    return row
+
+
+def invalidate(*args, **kwargs):
+    global _snapshot
+    cache.set(VERSION_KEY, time.time_ns(), None)
+    _snapshot = {"version": None, "checked_at": 0.0, "years": {}}
+
+
+def _current_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # 버전 키가 사라져도 이전 스냅샷과 겹치지 않도록 시간 기반으로 시작
+        cache.add(VERSION_KEY, time.time_ns(), None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def get_year(year):
+    # {"total_days", "bits", "holidays", "exam_days"} 또는 학사일정이 없는 해는 None
+    global _snapshot
+    from .models import InstructionalYear
+
+    snapshot = _snapshot
+    if snapshot["version"] is None or time.monotonic() - snapshot["checked_at"] >= RECHECK_SECONDS:
+        version = _current_version()
+        with _lock:
+            if _snapshot["version"] != version:
+                _snapshot = {"version": version, "checked_at": time.monotonic(), "years": {}}
+            else:
+                _snapshot["checked_at"] = time.monotonic()
+            snapshot = _snapshot
+    if year not in snapshot["years"]:
+        row = InstructionalYear.objects.filter(year=year).first()
+        snapshot["years"][year] = {
+            "total_days": row.total_days,
+            "bits": to_bits(row.days),
+            "holidays": {date.fromisoformat(day) for day in row.holidays},
+            "exam_days": {date.fromisoformat(day) for day in row.exam_days},
+        } if row else None
+    return snapshot["years"][year]
+
+
+def total_days(year):
+    info = get_year(year)
+    return info["total_days"] if info else 0
+
+
+def school_day_mask(year):
+    # 학기가 등록되지 않은 해는 주중(월~금)을 수업일로 간주
+    info = get_year(year)
+    return info["bits"] if info and info["bits"] else weekday_mask(year)
+
+
+def is_instructional_day(day):
+    year = school_year(day)
+    return not is_holiday(day) and bool((school_day_mask(year) >> day_index(year, day)) & 1)
+
+
+def is_holiday(day):
+    info = get_year(school_year(day))
+    return bool(info) and day in info["holidays"]
+
+
+def holidays_between(start, end):
+    days = []
+    for year in range(school_year(start), school_year(end) + 1):
+        info = get_year(year)
+        if info:
+            days += [day for day in info["holidays"] if start <= day <= end]
+    return sorted(days)
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from schedules.models import Term, InstructionalYear
+from schedules.signals import refresh_years
+
+
+class Command(BaseCommand):
+    help = "학기·휴업일 정보로 학년도별 수업일 표를 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--year', type=int, help="예: 2025")
+
+    def handle(self, *args, **options):
+        if options['year']:
+            years = {options['year']}
+        else:
+            years = set(Term.objects.values_list('year', flat=True)) | set(
+                InstructionalYear.objects.values_list('year', flat=True)
+            )
+        refresh_years(years)
+        for row in InstructionalYear.objects.filter(year__in=years).order_by('year'):
+            self.stdout.write(f"{row.year}학년도: 수업일 {row.total_days}일")
+        self.stdout.write(self.style.SUCCESS("수업일 재계산 완료"))
@@ -0,0 +1,52 @@
+# Generated by Django 5.1.7 on 2026-10-18 20:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InstructionalYear',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.IntegerField(unique=True)),
+                ('total_days', models.PositiveIntegerField(default=0)),
+                ('days', models.BinaryField()),
+                ('holidays', models.JSONField(default=list)),
+                ('exam_days', models.JSONField(default=list)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CalendarEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('event_type', models.CharField(choices=[('holiday', '휴업일'), ('exam', '시험')], max_length=20)),
+                ('name', models.CharField(max_length=100)),
+            ],
+            options={
+                'ordering': ['date'],
+                'unique_together': {('date', 'event_type')},
+            },
+        ),
+        migrations.CreateModel(
+            name='Term',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.IntegerField()),
+                ('name', models.CharField(max_length=20)),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField()),
+            ],
+            options={
+                'ordering': ['start_date'],
+                'unique_together': {('year', 'name')},
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+from django.db import models
+
+class Term(models.Model):
+    year = models.IntegerField()
+    name = models.CharField(max_length=20)
+    start_date = models.DateField()
+    end_date = models.DateField()
+
+    class Meta:
+        unique_together = ('year', 'name')
+        ordering = ['start_date']
+
+class CalendarEvent(models.Model):
+    EVENT_TYPE_CHOICES = [
+        ('holiday', '휴업일'),
+        ('exam', '시험'),
+    ]
+
+    date = models.DateField()
+    event_type = models.CharField(max_length=20, choices=EVENT_TYPE_CHOICES)
+    name = models.CharField(max_length=100)
+
+    class Meta:
+        unique_together = ('date', 'event_type')
+        ordering = ['date']
+
+class InstructionalYear(models.Model):
+    # 학년도별 수업일 미리 계산, i번째 비트 = 3월 1일 + i일
+    year = models.IntegerField(unique=True)
+    total_days = models.PositiveIntegerField(default=0)
+    days = models.BinaryField()
+    holidays = models.JSONField(default=list)
+    exam_days = models.JSONField(default=list)
@@ -0,0 +1,22 @@
+from rest_framework import serializers
+from .models import Term, CalendarEvent
+
+class TermSerializer(serializers.ModelSerializer):
+    startDate = serializers.DateField(source='start_date')
+    endDate = serializers.DateField(source='end_date')
+
+    class Meta:
+        model = Term
+        fields = ['id', 'year', 'name', 'startDate', 'endDate']
+
+    def validate(self, data):
+        if data['start_date'] > data['end_date']:
+            raise serializers.ValidationError("startDate는 endDate보다 늦을 수 없습니다.")
+        return data
+
+class CalendarEventSerializer(serializers.ModelSerializer):
+    eventType = serializers.ChoiceField(source='event_type', choices=CalendarEvent.EVENT_TYPE_CHOICES)
+
+    class Meta:
+        model = CalendarEvent
+        fields = ['id', 'date', 'eventType', 'name']
@@ -0,0 +1,44 @@
+from django.db.models.signals import post_init, post_save, post_delete
+from django.dispatch import Signal, receiver
+from .models import Term, CalendarEvent, InstructionalYear
+from .days import build_year, invalidate, school_year
+
+# 수업일 수가 바뀐 학년도를 알림 (year, previous_total, total)
+instructional_days_changed = Signal()
+
+
+def refresh_years(years):
+    for year in sorted(years):
+        previous = InstructionalYear.objects.filter(year=year).values_list('total_days', flat=True).first() or 0
+        row = build_year(year)
+        invalidate()
+        total = row.total_days if row else 0
+        if total != previous:
+            instructional_days_changed.send(sender=InstructionalYear, year=year, previous_total=previous, total=total)
+
+
+def _year(instance):
+    if isinstance(instance, Term):
+        return instance.__dict__.get('year')
+    day = instance.__dict__.get('date')
+    return school_year(day) if day else None
+
+
+@receiver(post_init, sender=Term)
+@receiver(post_init, sender=CalendarEvent)
+def remember_year(sender, instance, **kwargs):
+    instance._schedule_year = _year(instance) if instance.pk else None
+
+
+@receiver(post_save, sender=Term)
+@receiver(post_save, sender=CalendarEvent)
+def sync_saved_schedule(sender, instance, **kwargs):
+    years = {_year(instance), instance._schedule_year} - {None}
+    instance._schedule_year = _year(instance)
+    refresh_years(years)
+
+
+@receiver(post_delete, sender=Term)
+@receiver(post_delete, sender=CalendarEvent)
+def sync_deleted_schedule(sender, instance, **kwargs):
+    refresh_years({_year(instance)} - {None})
@@ -0,0 +1,10 @@
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('years/<int:year>', views.SchoolCalendarView.as_view(), name='school-calendar'),
+    path('terms', views.TermCreateView.as_view(), name='term-create'),
+    path('terms/<int:term_id>', views.TermDeleteView.as_view(), name='term-delete'),
+    path('events', views.CalendarEventCreateView.as_view(), name='calendar-event-create'),
+    path('events/<int:event_id>', views.CalendarEventDeleteView.as_view(), name='calendar-event-delete'),
+]
@@ -0,0 +1,102 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from django.shortcuts import get_object_or_404
+from datetime import datetime
+from utils.slack import send_success_slack, send_error_slack
+from .models import Term, CalendarEvent
+from .serializers import TermSerializer, CalendarEventSerializer
+from .days import get_year, year_start, school_year
+
+
+class SchoolCalendarView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, year):
+        start_time = datetime.now()
+        try:
+            info = get_year(year)
+            terms = Term.objects.filter(year=year)
+            events = CalendarEvent.objects.filter(date__gte=year_start(year), date__lt=year_start(year + 1))
+            send_success_slack(request, "학사일정 조회", start_time)
+            return Response({
+                "year": year,
+                "totalDays": info["total_days"] if info else 0,
+                "terms": TermSerializer(terms, many=True).data,
+                "events": CalendarEventSerializer(events, many=True).data
+            })
+        except Exception as e:
+            send_error_slack(request, "학사일정 조회", start_time)
+            return Response({"error": str(e)}, status=500)
+
+
+class TermCreateView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        start_time = datetime.now()
+        try:
+            serializer = TermSerializer(data=request.data)
+            if not serializer.is_valid():
+                send_error_slack(request, "학기 등록", start_time)
+                return Response(serializer.errors, status=400)
+            data = serializer.validated_data
+            if school_year(data['start_date']) != data['year'] or school_year(data['end_date']) != data['year']:
+                send_error_slack(request, "학기 등록", start_time)
+                return Response({"error": "학기 기간은 해당 학년도 안에 있어야 합니다."}, status=400)
+
+            term = serializer.save()
+            send_success_slack(request, "학기 등록", start_time)
+            return Response(TermSerializer(term).data, status=201)
+        except Exception as e:
+            send_error_slack(request, "학기 등록", start_time)
+            return Response({"error": str(e)}, status=500)
+
+
+class TermDeleteView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def delete(self, request, term_id):
+        start_time = datetime.now()
+        try:
+            term = get_object_or_404(Term, id=term_id)
+            term.delete()
+            send_success_slack(request, "학기 삭제", start_time)
+            return Response(status=204)
+        except Exception as e:
+            send_error_slack(request, "학기 삭제", start_time)
+            return Response({"error": str(e)}, status=500)
+
+
+class CalendarEventCreateView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        start_time = datetime.now()
+        try:
+            serializer = CalendarEventSerializer(data=request.data)
+            if not serializer.is_valid():
+                send_error_slack(request, "학사일정 등록", start_time)
+                return Response(serializer.errors, status=400)
+
+            event = serializer.save()
+            send_success_slack(request, "학사일정 등록", start_time)
+            return Response(CalendarEventSerializer(event).data, status=201)
+        except Exception as e:
+            send_error_slack(request, "학사일정 등록", start_time)
+            return Response({"error": str(e)}, status=500)
+
+
+class CalendarEventDeleteView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def delete(self, request, event_id):
+        start_time = datetime.now()
+        try:
+            event = get_object_or_404(CalendarEvent, id=event_id)
+            event.delete()
+            send_success_slack(request, "학사일정 삭제", start_time)
+            return Response(status=204)
+        except Exception as e:
+            send_error_slack(request, "학사일정 삭제", start_time)
+            return Response({"error": str(e)}, status=500)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class SubjectsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'subjects'
+
+    def ready(self):
+        from . import signals
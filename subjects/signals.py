@@ -0,0 +1,10 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from utils import reference_cache
+from .models import Subject
+
+
+@receiver(post_save, sender=Subject)
+@receiver(post_delete, sender=Subject)
+def invalidate_reference_cache(sender, instance, **kwargs):
+    reference_cache.invalidate()
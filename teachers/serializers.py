@@ -3,6 +3,7 @@ from accounts.models import User
 from classrooms.models import Classroom
 from subjects.models import Subject
 from .models import Teacher
+from utils.reference_cache import classroom_exists, subject_exists
 
 class UserSimpleSerializer(serializers.ModelSerializer):
     class Meta:
@@ -42,11 +43,9 @@ class TeacherDetailSerializer(serializers.ModelSerializer):
         fields = ['id', 'user', 'classroom', 'subjects']
 
 class TeacherUpdateSerializer(serializers.ModelSerializer):
-    classroom_id = serializers.PrimaryKeyRelatedField(
-        queryset=Classroom.objects.all(), required=False, write_only=True
-    )
-    subject_ids = serializers.PrimaryKeyRelatedField(
-        queryset=Subject.objects.all(), many=True, required=False, write_only=True
+    classroom_id = serializers.IntegerField(required=False, write_only=True)
+    subject_ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False, write_only=True
     )
 
     user = UserDetailSerializer(read_only=True)
@@ -61,22 +60,27 @@ class TeacherUpdateSerializer(serializers.ModelSerializer):
             'classroom', 'subjects'
         ]
 
+    def validate_classroom_id(self, value):
+        if not classroom_exists(value):
+            raise serializers.ValidationError(f'Invalid pk "{value}" - object does not exist.')
+        return value
+
+    def validate_subject_ids(self, value):
+        for subject_id in value:
+            if not subject_exists(subject_id):
+                raise serializers.ValidationError(f'Invalid pk "{subject_id}" - object does not exist.')
+        return value
+
     def update(self, instance, validated_data):
-        from classrooms.models import Classroom
-        classroom = validated_data.pop('classroom_id', None)
-        subject_list = validated_data.pop('subject_ids', [])
+        classroom_id = validated_data.pop('classroom_id', None)
+        subject_ids = validated_data.pop('subject_ids', [])
 
         Classroom.objects.filter(teacher=instance).update(teacher=None)
-
-        from subjects.models import Subject
         Subject.objects.filter(teacher=instance).update(teacher=None)
 
-        if classroom:
-            classroom.teacher = instance
-            classroom.save()
-
-        for subject in subject_list:
-            subject.teacher = instance
-            subject.save()
+        if classroom_id:
+            Classroom.objects.filter(id=classroom_id).update(teacher=instance)
+        if subject_ids:
+            Subject.objects.filter(id__in=subject_ids).update(teacher=instance)
 
         return instance
@@ -0,0 +1,95 @@
+import threading
+import time
+from django.core.cache import cache
+
+# 과목/학급처럼 거의 바뀌지 않는 기준 데이터를 프로세스 메모리에 보관
+# 버전 키는 여러 프로세스가 공유하는 Django cache(settings.CACHES)에 두어 다른 워커도 변경을 감지할 수 있게 함
+# 공유 버전은 RECHECK_SECONDS 간격으로만 다시 확인하고, 같은 프로세스의 변경은 invalidate()가 바로 반영
+VERSION_KEY = "reference_cache:version"
+RECHECK_SECONDS = 5
+
+_lock = threading.Lock()
+_snapshot = {"version": None, "checked_at": 0.0}
+
+
+def _current_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # 버전 키가 사라져도 이전 스냅샷과 겹치지 않도록 시간 기반으로 시작
+        cache.add(VERSION_KEY, time.time_ns(), None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def _load():
+    from subjects.models import Subject
+    from classrooms.models import Classroom
+
+    subjects_by_name = {}
+    subjects_by_id = {}
+    for subject_id, name in Subject.objects.order_by('id').values_list('id', 'name'):
+        subjects_by_name.setdefault(name, subject_id)
+        subjects_by_id[subject_id] = name
+
+    classrooms_by_key = {}
+    classrooms_by_id = {}
+    for classroom_id, grade, class_number in Classroom.objects.order_by('id').values_list('id', 'grade', 'class_number'):
+        classrooms_by_key.setdefault((grade, class_number), classroom_id)
+        classrooms_by_id[classroom_id] = (grade, class_number)
+
+    return {
+        "subjects_by_name": subjects_by_name,
+        "subjects_by_id": subjects_by_id,
+        "classrooms_by_key": classrooms_by_key,
+        "classrooms_by_id": classrooms_by_id,
+    }
+
+
+def _get():
+    global _snapshot
+    snapshot = _snapshot
+    if snapshot["version"] is not None and time.monotonic() - snapshot["checked_at"] < RECHECK_SECONDS:
+        return snapshot
+    version = _current_version()
+    with _lock:
+        if _snapshot["version"] != version:
+            _snapshot = {"version": version, "checked_at": time.monotonic(), **_load()}
+        else:
+            _snapshot["checked_at"] = time.monotonic()
+        snapshot = _snapshot
+    return snapshot
+
+
+def invalidate(*args, **kwargs):
+    global _snapshot
+    cache.set(VERSION_KEY, time.time_ns(), None)
+    _snapshot = {"version": None, "checked_at": 0.0}
+
+
+def get_subject_id(name):
+    return _get()["subjects_by_name"].get(name)
+
+
+def get_subject_ids(names):
+    subjects = _get()["subjects_by_name"]
+    return {name: subjects[name] for name in names if name in subjects}
+
+
+def get_subjects():
+    return dict(_get()["subjects_by_id"])
+
+
+def subject_exists(subject_id):
+    return subject_id in _get()["subjects_by_id"]
+
+
+def get_classroom_id(grade, class_number):
+    try:
+        key = (int(grade), int(class_number))
+    except (TypeError, ValueError):
+        return None
+    return _get()["classrooms_by_key"].get(key)
+
+
+def classroom_exists(classroom_id):
+    return classroom_id in _get()["classrooms_by_id"]